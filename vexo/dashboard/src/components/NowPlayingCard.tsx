@@ -13,7 +13,7 @@ interface PlayingGuild {
     duration_seconds?: number;
     genre?: string | null;
     discovery_reason?: string | null;
-    requested_by?: string | null;
+    requested_by?: string[] | null;
 }
 
 export default function NowPlayingCard() {
@@ -130,9 +130,9 @@ export default function NowPlayingCard() {
                     <p className="text-zinc-400 text-xs truncate font-medium mb-2">{playing.current_artist}</p>
 
                     <div className="flex flex-wrap gap-1.5">
-                        {playing.requested_by ? (
+                        {playing.requested_by?.length ? (
                             <span className="inline-flex items-center px-1.5 py-0.5 rounded text-[9px] font-medium bg-blue-500/10 text-blue-300 border border-blue-500/20">
-                                👤 {playing.requested_by.split(',')[0]}
+                                👤 {playing.requested_by[0]}
                             </span>
                         ) : (
                             <span className="inline-flex items-center px-1.5 py-0.5 rounded text-[9px] font-medium bg-purple-500/10 text-purple-300 border border-purple-500/20">
@@ -7,6 +7,8 @@ import json
 import logging
 import os
 import secrets
+import socket
+import sqlite3
 from collections import deque
 from datetime import datetime, UTC, timedelta
 from pathlib import Path
@@ -17,13 +19,144 @@ from aiohttp import web
 
 from discord.ext import commands
 
+from src.database.crud import (
+    AnalyticsCRUD,
+    GuildCRUD,
+    LibraryCRUD,
+    PreferenceCRUD,
+    SongCRUD,
+    SystemCRUD,
+    UserCRUD,
+)
 from src.utils.logging import get_logger, Category, Event
 
 log = get_logger(__name__)
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime  # type: ignore
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+DOCKER_SOCKET_PATH = "/var/run/docker.sock"
+
 STATIC_DIR = Path(__file__).parent.parent / "web" / "static"
 TEMPLATE_DIR = Path(__file__).parent.parent / "web" / "templates"
 
+# Username lists come back as JSON arrays where SQLite supports json_group_array
+# (3.38+ ships JSON1 built in); older builds fall back to comma-joined strings.
+_USER_LIST_AGG = (
+    "json_group_array(DISTINCT {col})"
+    if sqlite3.sqlite_version_info >= (3, 38, 0)
+    else "GROUP_CONCAT(DISTINCT {col})"
+)
+
+# Recent playback feed for /api/songs. Kept as constants so the statement text is
+# identical across requests and SQLite's prepared statement cache stays warm.
+_SONGS_SQL_TEMPLATE = """
+    SELECT 
+        ph.played_at,
+        s.title,
+        s.artist_name,
+        s.duration_seconds,
+        (SELECT GROUP_CONCAT(DISTINCT sg.genre) FROM song_genres sg WHERE sg.song_id = s.id) as genre,
+        CASE WHEN ph.discovery_source = 'user_request' THEN u.username ELSE NULL END as requested_by,
+        (SELECT {user_list} 
+         FROM song_reactions sr 
+         JOIN users u2 ON sr.user_id = u2.id 
+         WHERE sr.song_id = s.id AND sr.reaction = 'like' AND u2.username IS NOT NULL) as liked_by,
+        (SELECT {user_list} 
+         FROM song_reactions sr 
+         JOIN users u2 ON sr.user_id = u2.id 
+         WHERE sr.song_id = s.id AND sr.reaction = 'dislike' AND u2.username IS NOT NULL) as disliked_by
+    FROM playback_history ph
+    JOIN songs s ON ph.song_id = s.id
+    JOIN playback_sessions ps ON ph.session_id = ps.id
+    LEFT JOIN users u ON ph.for_user_id = u.id
+    {where_clause}
+    ORDER BY ph.played_at DESC
+    LIMIT 100
+"""
+_SONGS_SQL_ALL = _SONGS_SQL_TEMPLATE.format(
+    user_list=_USER_LIST_AGG.format(col="u2.username"),
+    where_clause="",
+)
+_SONGS_SQL_GUILD = _SONGS_SQL_TEMPLATE.format(
+    user_list=_USER_LIST_AGG.format(col="u2.username"),
+    where_clause="WHERE ps.guild_id = ?",
+)
+
+_CURRENT_SONG_USERS_SQL = """
+    SELECT 
+        (SELECT {user_list} FROM playback_history ph JOIN users u ON ph.for_user_id = u.id WHERE ph.song_id = ? AND ph.discovery_source = 'user_request' AND u.username IS NOT NULL) as requested_by,
+        (SELECT {user_list} FROM song_reactions sr JOIN users u ON sr.user_id = u.id WHERE sr.song_id = ? AND sr.reaction = 'like' AND u.username IS NOT NULL) as liked_by,
+        (SELECT {user_list} FROM song_reactions sr JOIN users u ON sr.user_id = u.id WHERE sr.song_id = ? AND sr.reaction = 'dislike' AND u.username IS NOT NULL) as disliked_by
+""".format(user_list=_USER_LIST_AGG.format(col="u.username"))
+
+# /api/services payload is constant apart from bot status and uptime, so it is
+# serialized once and those two fields are spliced in per request.
+_SERVICES_UPTIME_SENTINEL = b"__UPTIME__"
+_SERVICES_STATUS_SENTINEL = b"__BOT_STATUS__"
+_SERVICES_TEMPLATE = json.dumps(
+    {
+        "services": [
+            {
+                "id": "bot",
+                "name": "Discord Bot",
+                "description": "Core Discord bot handling commands and audio playback",
+                "status": _SERVICES_STATUS_SENTINEL.decode(),
+                "uptime": _SERVICES_UPTIME_SENTINEL.decode(),
+                "restartable": True,
+            },
+            {
+                "id": "dashboard",
+                "name": "Dashboard API",
+                "description": "Web API for the dashboard",
+                "status": "online",
+                "uptime": _SERVICES_UPTIME_SENTINEL.decode(),
+                "restartable": False,
+            },
+        ]
+    }
+).encode("utf-8")
+
+# Fixed error bodies, encoded once. Responses themselves can't be shared across requests.
+_UNAUTHORIZED_BODY = b'{"error":"unauthorized"}'
+_UNKNOWN_SERVICE_BODY = b'{"error":"Unknown service"}'
+_DASHBOARD_SELF_RESTART_BODY = b'{"error":"Dashboard cannot restart itself"}'
+_RESTART_DOCKER_BODY = b'{"status":"restarting","method":"docker"}'
+_RESTART_PROCESS_EXIT_BODY = b'{"status":"restarting","method":"process_exit"}'
+_RESTART_PENDING_BODY = b'{"status":"restarting","method":"pending"}'
+
+
+def _json(obj, status: int = 200) -> web.Response:
+    """JSON response serialized with orjson when available (falls back to json.dumps)."""
+    if orjson is not None:
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(obj).encode("utf-8")
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+def _unauthorized() -> web.Response:
+    return web.Response(body=_UNAUTHORIZED_BODY, status=401, content_type="application/json")
+
+
+def _parse_user_list(value) -> list[str]:
+    """Normalize an aggregated username column into a list."""
+    if not value:
+        return []
+    if isinstance(value, str) and value.startswith("["):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return str(value).split(",")
+
 
 class WebSocketLogHandler(logging.Handler):
     """Log handler that broadcasts to WebSocket clients with structured parsing."""
@@ -102,10 +235,12 @@ class WebSocketLogHandler(logging.Handler):
 
 class WebSocketManager:
     """Manages WebSocket connections for live logs."""
+
+    RECENT_LOG_LIMIT = 500  # Backlog replayed to newly connected clients
     
-    def __init__(self):
+    def __init__(self, max_recent: int = RECENT_LOG_LIMIT):
         self.clients: set[web.WebSocketResponse] = set()
-        self.recent_logs: deque = deque(maxlen=500)
+        self.recent_logs: deque[dict] = deque(maxlen=max_recent)
     
     async def broadcast(self, message: dict):
         self.recent_logs.append(message)
@@ -120,6 +255,10 @@ class WebSocketManager:
 
 class DashboardCog(commands.Cog):
     """Web dashboard for stats and analytics."""
+
+    BULK_ACTION_CONCURRENCY = 4  # Max extensions loaded/unloaded at once by bulk actions
+    METRICS_SAMPLE_INTERVAL = 1.0  # Seconds between psutil samples for /api/status
+    DOCKER_API_TIMEOUT = 2.0  # Seconds before falling back from a hung dockerd
     
     def __init__(self, bot: commands.Bot, host: str = "127.0.0.1", port: int = 8080):
         self.bot = bot
@@ -132,11 +271,38 @@ class DashboardCog(commands.Cog):
         self._cog_admin_token = os.getenv("WEB_ADMIN_TOKEN")
         self._cog_action_lock = asyncio.Lock()
         self._oauth_session_ttl_hours = 24 * 14
+        self._process_create_time: float | None = None
+        self._uptime_cache: bytes = b""
+        self._uptime_cache_ts = float("-inf")
+        self._ext_list_cache: tuple[int, list[str]] | None = None
+        self._metrics_task: asyncio.Task | None = None
+        self._metrics: dict | None = None
+        self._services_task: asyncio.Task | None = None
+        self._services_bytes: bytes | None = None
+        self._container_name = self._read_container_name()
+        self._docker_restart_path = f"/containers/{self._container_name}/restart"
+        # The socket is bind-mounted at container start; probe once instead of per request.
+        self._has_docker_sock = os.path.exists(DOCKER_SOCKET_PATH)
+        self._restart_task: asyncio.Task | None = None
+        self._restart_latch = asyncio.Event()
+
+        # CRUD helpers are stateless wrappers around bot.db; build them once.
+        self._guild_crud: GuildCRUD | None = None
+        self._song_crud: SongCRUD | None = None
+        self._user_crud: UserCRUD | None = None
+        self._analytics_crud: AnalyticsCRUD | None = None
+        self._system_crud: SystemCRUD | None = None
+        self._library_crud: LibraryCRUD | None = None
+        self._preference_crud: PreferenceCRUD | None = None
     
     async def cog_load(self):
-        self.app = web.Application()
+        self._init_cruds()
+        self.app = web.Application(middlewares=[self._admin_middleware])
         self._setup_routes()
         
+        self._metrics_task = asyncio.create_task(self._metrics_loop())
+        self._services_task = asyncio.create_task(self._services_loop())
+
         self._log_handler = WebSocketLogHandler(self.ws_manager, self.bot.loop)
         self._log_handler.setLevel(logging.INFO)
         logging.getLogger().addHandler(self._log_handler)
@@ -149,11 +315,33 @@ class DashboardCog(commands.Cog):
         log.event(Category.SYSTEM, "dashboard_started", host=self.host, port=self.port)
     
     async def cog_unload(self):
+        if self._metrics_task:
+            self._metrics_task.cancel()
+            self._metrics_task = None
+        if self._services_task:
+            self._services_task.cancel()
+            self._services_task = None
         if self._log_handler:
             logging.getLogger().removeHandler(self._log_handler)
         if self.runner:
             await self.runner.cleanup()
     
+    def _init_cruds(self) -> bool:
+        """Create the shared CRUD helpers once the database is available."""
+        if self._guild_crud is not None:
+            return True
+        db = getattr(self.bot, "db", None)
+        if not db:
+            return False
+        self._guild_crud = GuildCRUD(db)
+        self._song_crud = SongCRUD(db)
+        self._user_crud = UserCRUD(db)
+        self._analytics_crud = AnalyticsCRUD(db)
+        self._system_crud = SystemCRUD(db)
+        self._library_crud = LibraryCRUD(db)
+        self._preference_crud = PreferenceCRUD(db)
+        return True
+
     def _setup_routes(self):
         # Static files
         if STATIC_DIR.exists():
@@ -323,7 +511,7 @@ class DashboardCog(commands.Cog):
             and config.SPOTIFY_OAUTH_CLIENT_SECRET
             and config.SPOTIFY_OAUTH_REDIRECT_URI
         )
-        return web.json_response(
+        return _json(
             {
                 "discord_oauth_enabled": discord_enabled,
                 "spotify_oauth_enabled": spotify_enabled,
@@ -339,7 +527,7 @@ class DashboardCog(commands.Cog):
             and config.DISCORD_OAUTH_CLIENT_SECRET
             and config.DISCORD_OAUTH_REDIRECT_URI
         ):
-            return web.json_response({"error": "discord_oauth_not_configured"}, status=503)
+            return _json({"error": "discord_oauth_not_configured"}, status=503)
 
         redirect_path = request.query.get("redirect") or "/"
         state = await self._create_oauth_state(
@@ -361,16 +549,15 @@ class DashboardCog(commands.Cog):
 
     async def _handle_discord_auth_callback(self, request: web.Request) -> web.Response:
         from src.config import config
-        from src.database.crud import UserCRUD
 
         code = request.query.get("code")
         state = request.query.get("state")
         if not code or not state:
-            return web.json_response({"error": "missing_code_or_state"}, status=400)
+            return _json({"error": "missing_code_or_state"}, status=400)
 
         state_row = await self._consume_oauth_state(state=state, provider="discord")
         if not state_row:
-            return web.json_response({"error": "invalid_or_expired_state"}, status=400)
+            return _json({"error": "invalid_or_expired_state"}, status=400)
 
         token_payload = {
             "client_id": config.DISCORD_OAUTH_CLIENT_ID,
@@ -390,7 +577,7 @@ class DashboardCog(commands.Cog):
                 ) as token_resp:
                     if token_resp.status >= 300:
                         text = await token_resp.text()
-                        return web.json_response(
+                        return _json(
                             {"error": "discord_token_exchange_failed", "status": token_resp.status, "detail": text},
                             status=502,
                         )
@@ -398,7 +585,7 @@ class DashboardCog(commands.Cog):
 
                 access_token = token_data.get("access_token")
                 if not access_token:
-                    return web.json_response({"error": "discord_missing_access_token"}, status=502)
+                    return _json({"error": "discord_missing_access_token"}, status=502)
 
                 async with session.get(
                     "https://discord.com/api/users/@me",
@@ -407,13 +594,13 @@ class DashboardCog(commands.Cog):
                 ) as me_resp:
                     if me_resp.status >= 300:
                         text = await me_resp.text()
-                        return web.json_response(
+                        return _json(
                             {"error": "discord_user_fetch_failed", "status": me_resp.status, "detail": text},
                             status=502,
                         )
                     me_data = await me_resp.json()
         except Exception as e:
-            return web.json_response({"error": "discord_oauth_request_failed", "detail": str(e)}, status=502)
+            return _json({"error": "discord_oauth_request_failed", "detail": str(e)}, status=502)
 
         discord_user_id = int(me_data["id"])
         username = me_data.get("username")
@@ -425,8 +612,8 @@ class DashboardCog(commands.Cog):
         expires_in = int(token_data.get("expires_in", 0) or 0)
         expires_at = self._to_iso(self._utc_now() + timedelta(seconds=max(0, expires_in)))
 
-        user_crud = UserCRUD(self.bot.db)
-        await user_crud.get_or_create(discord_user_id, username or global_name)
+        self._init_cruds()
+        await self._user_crud.get_or_create(discord_user_id, username or global_name)
 
         await self.bot.db.execute(
             """
@@ -478,7 +665,7 @@ class DashboardCog(commands.Cog):
         }
 
         if self._wants_json(request):
-            resp = web.json_response(response_payload)
+            resp = _json(response_payload)
         else:
             sep = "&" if "?" in redirect_path else "?"
             resp = web.HTTPFound(f"{redirect_path}{sep}auth=discord_success")
@@ -496,7 +683,7 @@ class DashboardCog(commands.Cog):
     async def _handle_auth_me(self, request: web.Request) -> web.Response:
         session = await self._get_active_auth_session(request)
         if not session:
-            return web.json_response({"authenticated": False})
+            return _json({"authenticated": False})
 
         discord_user_id = int(session["discord_user_id"])
         discord_row = await self.bot.db.fetch_one(
@@ -508,7 +695,7 @@ class DashboardCog(commands.Cog):
             (discord_user_id,),
         )
 
-        return web.json_response(
+        return _json(
             {
                 "authenticated": True,
                 "discord_user_id": str(discord_user_id),
@@ -525,7 +712,7 @@ class DashboardCog(commands.Cog):
                 "UPDATE auth_sessions SET revoked_at = ? WHERE session_token = ?",
                 (self._to_iso(self._utc_now()), token),
             )
-        resp = web.json_response({"status": "ok"})
+        resp = _json({"status": "ok"})
         resp.del_cookie("vexo_session")
         return resp
 
@@ -534,14 +721,14 @@ class DashboardCog(commands.Cog):
 
         session = await self._get_active_auth_session(request)
         if not session:
-            return web.json_response({"error": "discord_auth_required"}, status=401)
+            return _json({"error": "discord_auth_required"}, status=401)
 
         if not (
             config.SPOTIFY_OAUTH_CLIENT_ID
             and config.SPOTIFY_OAUTH_CLIENT_SECRET
             and config.SPOTIFY_OAUTH_REDIRECT_URI
         ):
-            return web.json_response({"error": "spotify_oauth_not_configured"}, status=503)
+            return _json({"error": "spotify_oauth_not_configured"}, status=503)
 
         redirect_path = request.query.get("redirect") or "/"
         state = await self._create_oauth_state(
@@ -568,15 +755,15 @@ class DashboardCog(commands.Cog):
         code = request.query.get("code")
         state = request.query.get("state")
         if not code or not state:
-            return web.json_response({"error": "missing_code_or_state"}, status=400)
+            return _json({"error": "missing_code_or_state"}, status=400)
 
         state_row = await self._consume_oauth_state(state=state, provider="spotify")
         if not state_row:
-            return web.json_response({"error": "invalid_or_expired_state"}, status=400)
+            return _json({"error": "invalid_or_expired_state"}, status=400)
 
         owner_discord_id = state_row.get("owner_discord_id")
         if not owner_discord_id:
-            return web.json_response({"error": "spotify_state_missing_owner"}, status=400)
+            return _json({"error": "spotify_state_missing_owner"}, status=400)
 
         basic = base64.b64encode(
             f"{config.SPOTIFY_OAUTH_CLIENT_ID}:{config.SPOTIFY_OAUTH_CLIENT_SECRET}".encode("utf-8")
@@ -600,7 +787,7 @@ class DashboardCog(commands.Cog):
                 ) as token_resp:
                     if token_resp.status >= 300:
                         text = await token_resp.text()
-                        return web.json_response(
+                        return _json(
                             {"error": "spotify_token_exchange_failed", "status": token_resp.status, "detail": text},
                             status=502,
                         )
@@ -608,7 +795,7 @@ class DashboardCog(commands.Cog):
 
                 access_token = token_data.get("access_token")
                 if not access_token:
-                    return web.json_response({"error": "spotify_missing_access_token"}, status=502)
+                    return _json({"error": "spotify_missing_access_token"}, status=502)
 
                 async with session.get(
                     "https://api.spotify.com/v1/me",
@@ -617,17 +804,17 @@ class DashboardCog(commands.Cog):
                 ) as me_resp:
                     if me_resp.status >= 300:
                         text = await me_resp.text()
-                        return web.json_response(
+                        return _json(
                             {"error": "spotify_user_fetch_failed", "status": me_resp.status, "detail": text},
                             status=502,
                         )
                     me_data = await me_resp.json()
         except Exception as e:
-            return web.json_response({"error": "spotify_oauth_request_failed", "detail": str(e)}, status=502)
+            return _json({"error": "spotify_oauth_request_failed", "detail": str(e)}, status=502)
 
         spotify_user_id = me_data.get("id")
         if not spotify_user_id:
-            return web.json_response({"error": "spotify_missing_user_id"}, status=502)
+            return _json({"error": "spotify_missing_user_id"}, status=502)
 
         refresh_token = token_data.get("refresh_token")
         token_type = token_data.get("token_type")
@@ -668,7 +855,7 @@ class DashboardCog(commands.Cog):
 
         redirect_path = state_row.get("redirect_path") or "/"
         if self._wants_json(request):
-            return web.json_response(
+            return _json(
                 {
                     "linked": True,
                     "discord_user_id": str(owner_discord_id),
@@ -695,6 +882,12 @@ class DashboardCog(commands.Cog):
 
         return self._is_loopback(request)
 
+    @web.middleware
+    async def _admin_middleware(self, request: web.Request, handler):
+        """Resolve admin access once per request; handlers read ``request["is_admin"]``."""
+        request["is_admin"] = self._is_admin(request)
+        return await handler(request)
+
     def _normalize_extension(self, cog_name: str) -> str | None:
         """Convert user input to a safe extension module name under src.cogs.*."""
         name = (cog_name or "").strip()
@@ -716,13 +909,37 @@ class DashboardCog(commands.Cog):
         return module
 
     def _list_available_extensions(self) -> list[str]:
+        """List extension modules, rescanning only when the cogs directory changes."""
         cogs_dir = Path(__file__).parent
+        try:
+            mtime = cogs_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._ext_list_cache
+        if mtime is not None and cached and cached[0] == mtime:
+            return list(cached[1])
+
         modules: list[str] = []
         for cog_file in cogs_dir.glob("*.py"):
             if cog_file.name.startswith("_"):
                 continue
             modules.append(f"src.cogs.{cog_file.stem}")
-        return sorted(modules)
+        modules.sort()
+        if mtime is not None:
+            self._ext_list_cache = (mtime, modules)
+        return list(modules)
+
+    def _extension_state(self) -> dict:
+        return {
+            "loaded_extensions": sorted(self.bot.extensions),
+            "loaded_cogs": sorted(self.bot.cogs),
+        }
+
+    @staticmethod
+    def _wants_state(request: web.Request) -> bool:
+        """Action responses omit the loaded lists unless ?include_state=1; GET /api/cogs has them."""
+        return request.query.get("include_state", "").lower() in {"1", "true", "yes"}
 
     async def _sync_commands(self) -> dict:
         try:
@@ -732,6 +949,7 @@ class DashboardCog(commands.Cog):
             return {"ok": False, "error": str(e)}
 
     async def _run_extension_action(self, action: str, module: str) -> dict:
+        self._ext_list_cache = None
         try:
             if action == "load":
                 await self.bot.load_extension(module)
@@ -749,32 +967,29 @@ class DashboardCog(commands.Cog):
             return {"ok": False, "module": module, "error": str(e)}
 
     async def _handle_cogs_list(self, request: web.Request) -> web.Response:
-        if not self._is_admin(request):
-            return web.json_response({"error": "unauthorized"}, status=401)
+        if not request["is_admin"]:
+            return _unauthorized()
 
-        available = self._list_available_extensions()
-        loaded = sorted(list(self.bot.extensions.keys()))
-        return web.json_response(
+        return _json(
             {
-                "available_extensions": available,
-                "loaded_extensions": loaded,
-                "loaded_cogs": sorted(list(self.bot.cogs.keys())),
+                "available_extensions": self._list_available_extensions(),
+                **self._extension_state(),
                 "auth": {"mode": "token" if self._cog_admin_token else "loopback"},
             }
         )
 
     async def _handle_cog_action(self, request: web.Request) -> web.Response:
-        if not self._is_admin(request):
-            return web.json_response({"error": "unauthorized"}, status=401)
+        if not request["is_admin"]:
+            return _unauthorized()
 
         cog = request.match_info["cog"]
         action = request.match_info["action"]
         if action not in {"load", "unload", "reload"}:
-            return web.json_response({"error": "invalid_action"}, status=400)
+            return _json({"error": "invalid_action"}, status=400)
 
         module = self._normalize_extension(cog)
         if not module:
-            return web.json_response({"error": "unknown_cog"}, status=404)
+            return _json({"error": "unknown_cog"}, status=404)
 
         payload = {}
         try:
@@ -794,7 +1009,7 @@ class DashboardCog(commands.Cog):
                         await self._sync_commands()
 
             asyncio.create_task(do_later())
-            return web.json_response({"accepted": True, "module": module, "action": action}, status=202)
+            return _json({"accepted": True, "module": module, "action": action}, status=202)
 
         async with self._cog_action_lock:
             result = await self._run_extension_action(action, module)
@@ -802,23 +1017,23 @@ class DashboardCog(commands.Cog):
             if sync and result.get("ok"):
                 sync_result = await self._sync_commands()
 
-        return web.json_response(
-            {
-                "action": action,
-                "result": result,
-                "synced": sync_result,
-                "loaded_extensions": sorted(list(self.bot.extensions.keys())),
-                "loaded_cogs": sorted(list(self.bot.cogs.keys())),
-            }
-        )
+        response = {
+            "action": action,
+            "module": module,
+            "result": result,
+            "synced": sync_result,
+        }
+        if self._wants_state(request):
+            response.update(self._extension_state())
+        return _json(response)
 
     async def _handle_cogs_bulk_action(self, request: web.Request) -> web.Response:
-        if not self._is_admin(request):
-            return web.json_response({"error": "unauthorized"}, status=401)
+        if not request["is_admin"]:
+            return _unauthorized()
 
         action = request.match_info["action"]
         if action not in {"load_all", "unload_all", "reload_all"}:
-            return web.json_response({"error": "invalid_action"}, status=400)
+            return _json({"error": "invalid_action"}, status=400)
 
         payload = {}
         try:
@@ -841,29 +1056,34 @@ class DashboardCog(commands.Cog):
             targets = [m for m in targets if m not in self.bot.extensions]
 
         op = {"load_all": "load", "unload_all": "unload", "reload_all": "reload"}[action]
-        results: list[dict] = []
+        sem = asyncio.Semaphore(self.BULK_ACTION_CONCURRENCY)
+
+        async def run(module: str) -> dict:
+            async with sem:
+                return await self._run_extension_action(op, module)
 
         async with self._cog_action_lock:
-            for module in targets:
-                results.append(await self._run_extension_action(op, module))
+            # _run_extension_action never raises, so one failure can't cancel the group.
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(run(module)) for module in targets]
+            results: list[dict] = [t.result() for t in tasks]
 
             sync_result = {"ok": True}
             if sync:
                 sync_result = await self._sync_commands()
 
         ok_count = sum(1 for r in results if r.get("ok"))
-        return web.json_response(
-            {
-                "action": action,
-                "operation": op,
-                "results": results,
-                "ok": ok_count,
-                "failed": len(results) - ok_count,
-                "synced": sync_result,
-                "loaded_extensions": sorted(list(self.bot.extensions.keys())),
-                "loaded_cogs": sorted(list(self.bot.cogs.keys())),
-            }
-        )
+        response = {
+            "action": action,
+            "operation": op,
+            "results": results,
+            "ok": ok_count,
+            "failed": len(results) - ok_count,
+            "synced": sync_result,
+        }
+        if self._wants_state(request):
+            response.update(self._extension_state())
+        return _json(response)
     
     async def _handle_index(self, request: web.Request) -> web.Response:
         html_file = TEMPLATE_DIR / "index.html"
@@ -871,33 +1091,55 @@ class DashboardCog(commands.Cog):
             return web.Response(text=html_file.read_text(encoding='utf-8'), content_type="text/html")
         return web.Response(text="Dashboard template not found", status=404)
     
-    async def _handle_status(self, request: web.Request) -> web.Response:
+    @staticmethod
+    def _sample_system_metrics() -> dict:
+        """Read psutil counters; blocking, so only call from an executor."""
         import psutil
         process = psutil.Process()
-        return web.json_response({
+        return {
+            "cpu_percent": psutil.cpu_percent(),
+            "ram_percent": psutil.virtual_memory().percent,
+            "process_ram_mb": round(process.memory_info().rss / 1024 / 1024, 2),
+        }
+
+    async def _metrics_loop(self) -> None:
+        """Keep system metrics fresh off the event loop so /api/status never blocks on /proc."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                self._metrics = await loop.run_in_executor(None, self._sample_system_metrics)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.debug_cat(Category.SYSTEM, "dashboard_metrics_sample_failed", error=str(e))
+            await asyncio.sleep(self.METRICS_SAMPLE_INTERVAL)
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        metrics = self._metrics
+        if metrics is None:
+            metrics = await asyncio.get_running_loop().run_in_executor(None, self._sample_system_metrics)
+        return _json({
             "status": "online",
             "guilds": len(self.bot.guilds),
             "voice_connections": len(self.bot.voice_clients),
             "latency_ms": round(self.bot.latency * 1000, 2),
-            "cpu_percent": psutil.cpu_percent(),
-            "ram_percent": psutil.virtual_memory().percent,
-            "process_ram_mb": round(process.memory_info().rss / 1024 / 1024, 2)
+            **metrics,
         })
 
     async def _handle_obs_status(self, request: web.Request) -> web.Response:
         """Get OBS relay status for dashboard/debugging."""
         music = self.bot.get_cog("MusicCog")
         if not music or not hasattr(music, "get_obs_audio_status"):
-            return web.json_response({"enabled": False, "available": False})
+            return _json({"enabled": False, "available": False})
 
         status = await music.get_obs_audio_status()
         status["available"] = True
         status["url"] = f"http://{request.host}/api/obs/audio"
-        return web.json_response(status)
+        return _json(status)
 
     async def _handle_obs_audio(self, request: web.Request) -> web.StreamResponse:
         """Stream live MP3 audio so OBS can add it as a media source."""
-        if not self._is_loopback(request) and not self._is_admin(request):
+        if not self._is_loopback(request) and not request["is_admin"]:
             return web.Response(status=401, text="unauthorized")
 
         music = self.bot.get_cog("MusicCog")
@@ -914,10 +1156,9 @@ class DashboardCog(commands.Cog):
             headers={
                 "Content-Type": "audio/mpeg",
                 "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Connection": "keep-alive",
             },
         )
+        response.enable_chunked_encoding()
         await response.prepare(request)
 
         try:
@@ -966,29 +1207,27 @@ class DashboardCog(commands.Cog):
                 
                 # Fetch detailed interaction stats for current song
                 if hasattr(self.bot, "db") and player.current.song_db_id:
-                    stats = await self.bot.db.fetch_one("""
-                        SELECT 
-                            (SELECT GROUP_CONCAT(DISTINCT u.username) FROM playback_history ph JOIN users u ON ph.for_user_id = u.id WHERE ph.song_id = ? AND ph.discovery_source = "user_request") as requested_by,
-                            (SELECT GROUP_CONCAT(DISTINCT u.username) FROM song_reactions sr JOIN users u ON sr.user_id = u.id WHERE sr.song_id = ? AND sr.reaction = 'like') as liked_by,
-                            (SELECT GROUP_CONCAT(DISTINCT u.username) FROM song_reactions sr JOIN users u ON sr.user_id = u.id WHERE sr.song_id = ? AND sr.reaction = 'dislike') as disliked_by
-                    """, (player.current.song_db_id, player.current.song_db_id, player.current.song_db_id))
+                    stats = await self.bot.db.fetch_one(
+                        _CURRENT_SONG_USERS_SQL,
+                        (player.current.song_db_id, player.current.song_db_id, player.current.song_db_id),
+                    )
                     if stats:
-                        data["requested_by"] = stats["requested_by"]
-                        data["liked_by"] = stats["liked_by"]
-                        data["disliked_by"] = stats["disliked_by"]
+                        data["requested_by"] = _parse_user_list(stats["requested_by"])
+                        data["liked_by"] = _parse_user_list(stats["liked_by"])
+                        data["disliked_by"] = _parse_user_list(stats["disliked_by"])
             guilds.append(data)
-        return web.json_response({"guilds": guilds})
+        return _json({"guilds": guilds})
     
     async def _handle_guild_detail(self, request: web.Request) -> web.Response:
         guild_id = int(request.match_info["guild_id"])
         guild = self.bot.get_guild(guild_id)
         if not guild:
-            return web.json_response({"error": "Not found"}, status=404)
+            return _json({"error": "Not found"}, status=404)
         
         music = self.bot.get_cog("MusicCog")
         player = music.get_player(guild_id) if music else None
         
-        return web.json_response({
+        return _json({
             "id": str(guild.id),
             "name": guild.name,
             "member_count": guild.member_count,
@@ -997,12 +1236,10 @@ class DashboardCog(commands.Cog):
     
     async def _handle_guild_settings(self, request: web.Request) -> web.Response:
         guild_id = int(request.match_info["guild_id"])
-        if not hasattr(self.bot, "db"):
-            return web.json_response({})
-        from src.database.crud import GuildCRUD
-        crud = GuildCRUD(self.bot.db)
-        settings = await crud.get_all_settings(guild_id)
-        return web.json_response(settings)
+        if not self._init_cruds():
+            return _json({})
+        settings = await self._guild_crud.get_all_settings(guild_id)
+        return _json(settings)
     
     async def _handle_update_settings(self, request: web.Request) -> web.Response:
         guild_id = int(request.match_info["guild_id"])
@@ -1010,9 +1247,8 @@ class DashboardCog(commands.Cog):
         
         log.info(f"Dashboard settings update received - guild_id={guild_id}, data={data}")
         
-        if hasattr(self.bot, "db"):
-            from src.database.crud import GuildCRUD
-            crud = GuildCRUD(self.bot.db)
+        if self._init_cruds():
+            crud = self._guild_crud
             
             # Save settings
             if "pre_buffer" in data:
@@ -1040,12 +1276,13 @@ class DashboardCog(commands.Cog):
             # Apply to active player if exists
             music = self.bot.get_cog("MusicCog")
             if music:
+                music.invalidate_guild_settings(guild_id)
                 player = music.get_player(guild_id)
                 if player:
                     if "pre_buffer" in data:
                         player.pre_buffer = bool(data["pre_buffer"])
                         
-        return web.json_response({"status": "ok"})
+        return _json({"status": "ok"})
     
     async def _handle_control(self, request: web.Request) -> web.Response:
         """Handle playback controls."""
@@ -1054,11 +1291,11 @@ class DashboardCog(commands.Cog):
         
         music = self.bot.get_cog("MusicCog")
         if not music:
-            return web.json_response({"error": "Music cog not loaded"}, status=503)
+            return _json({"error": "Music cog not loaded"}, status=503)
         
         player = music.get_player(guild_id)
         if not player.voice_client:
-            return web.json_response({"error": "Not connected"}, status=400)
+            return _json({"error": "Not connected"}, status=400)
         
         try:
             if action == "pause":
@@ -1083,54 +1320,28 @@ class DashboardCog(commands.Cog):
                 
                 await player.voice_client.disconnect()
             
-            return web.json_response({"status": "ok", "action": action})
+            return _json({"status": "ok", "action": action})
         except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
+            return _json({"error": str(e)}, status=500)
     
     async def _handle_songs(self, request: web.Request) -> web.Response:
         """Get song library."""
         if not hasattr(self.bot, "db"):
-            return web.json_response({"songs": []})
+            return _json({"songs": []})
         
         guild_id = request.query.get("guild_id")
-        params = []
-        where_clause = ""
-        
         if guild_id:
             # Filter by playback history in this guild
-            where_clause = "WHERE ps.guild_id = ?"
-            params.append(int(guild_id))
-        
-        query = f"""
-            SELECT 
-                ph.played_at,
-                s.title,
-                s.artist_name,
-                s.duration_seconds,
-                (SELECT GROUP_CONCAT(DISTINCT sg.genre) FROM song_genres sg WHERE sg.song_id = s.id) as genre,
-                CASE WHEN ph.discovery_source = 'user_request' THEN u.username ELSE NULL END as requested_by,
-                (SELECT GROUP_CONCAT(DISTINCT u2.username) 
-                 FROM song_reactions sr 
-                 JOIN users u2 ON sr.user_id = u2.id 
-                 WHERE sr.song_id = s.id AND sr.reaction = 'like') as liked_by,
-                (SELECT GROUP_CONCAT(DISTINCT u2.username) 
-                 FROM song_reactions sr 
-                 JOIN users u2 ON sr.user_id = u2.id 
-                 WHERE sr.song_id = s.id AND sr.reaction = 'dislike') as disliked_by
-            FROM playback_history ph
-            JOIN songs s ON ph.song_id = s.id
-            JOIN playback_sessions ps ON ph.session_id = ps.id
-            LEFT JOIN users u ON ph.for_user_id = u.id
-            {where_clause}
-            ORDER BY ph.played_at DESC
-            LIMIT 100
-        """
-        songs = await self.bot.db.fetch_all(query, tuple(params))
+            songs = await self.bot.db.fetch_all(_SONGS_SQL_GUILD, (int(guild_id),))
+        else:
+            songs = await self.bot.db.fetch_all(_SONGS_SQL_ALL)
         
         # Serialize for JSON
         data = []
         for s in songs:
             item = dict(s)
+            item["liked_by"] = _parse_user_list(item.get("liked_by"))
+            item["disliked_by"] = _parse_user_list(item.get("disliked_by"))
             # Handle datetime fields if they exist as objects
             for key in ["created_at", "last_played"]:
                 if key in item and item[key]:
@@ -1139,25 +1350,22 @@ class DashboardCog(commands.Cog):
                     # If string, leave as is
             data.append(item)
             
-        return web.json_response({"songs": data})
+        return _json({"songs": data})
     
     async def _handle_genres(self, request: web.Request) -> web.Response:
         """Get list of all genres."""
-        if not hasattr(self.bot, "db"):
-            return web.json_response({"genres": []})
+        if not self._init_cruds():
+            return _json({"genres": []})
             
-        from src.database.crud import SongCRUD
-        crud = SongCRUD(self.bot.db)
-        genres = await crud.get_all_genres()
-        return web.json_response({"genres": genres})
+        genres = await self._song_crud.get_all_genres()
+        return _json({"genres": genres})
     
     async def _handle_analytics(self, request: web.Request) -> web.Response:
         """Get analytics data."""
-        if not hasattr(self.bot, "db"):
-            return web.json_response({"error": "No database"})
+        if not self._init_cruds():
+            return _json({"error": "No database"})
         
-        from src.database.crud import AnalyticsCRUD
-        crud = AnalyticsCRUD(self.bot.db) # Updated
+        crud = self._analytics_crud
         
         guild_id = request.query.get("guild_id")
         gid = int(guild_id) if guild_id else None
@@ -1192,7 +1400,7 @@ class DashboardCog(commands.Cog):
                 "playlists_imported": d["playlists"],
             })
 
-        return web.json_response({
+        return _json({
             "total_songs": stats["total_songs"],
             "total_users": stats["total_users"],
             "total_plays": stats["total_plays"],
@@ -1210,25 +1418,23 @@ class DashboardCog(commands.Cog):
     
     async def _handle_top_songs(self, request: web.Request) -> web.Response:
         """Get top songs list."""
-        if not hasattr(self.bot, "db"):
-             return web.json_response({"songs": []})
+        if not self._init_cruds():
+             return _json({"songs": []})
         
-        from src.database.crud import AnalyticsCRUD
-        crud = AnalyticsCRUD(self.bot.db)
+        crud = self._analytics_crud
         
         guild_id = request.query.get("guild_id")
         gid = int(guild_id) if guild_id else None
         
         songs = await crud.get_top_songs(limit=10, guild_id=gid)
-        return web.json_response({"songs": [dict(r) for r in songs]})
+        return _json({"songs": [dict(r) for r in songs]})
     
     async def _handle_users(self, request: web.Request) -> web.Response:
         """Get users list."""
-        if not hasattr(self.bot, "db"):
-             return web.json_response({"users": []})
+        if not self._init_cruds():
+             return _json({"users": []})
              
-        from src.database.crud import AnalyticsCRUD
-        crud = AnalyticsCRUD(self.bot.db)
+        crud = self._analytics_crud
         
         guild_id = request.query.get("guild_id")
         gid = int(guild_id) if guild_id else None
@@ -1242,27 +1448,26 @@ class DashboardCog(commands.Cog):
             d["id"] = str(d["id"])
             d["formatted_id"] = d["id"]
             data.append(d)
-        return web.json_response({"users": data})
+        return _json({"users": data})
 
     async def _handle_global_settings(self, request: web.Request) -> web.Response:
         """Get or update global settings."""
-        if not hasattr(self.bot, "db"):
-            return web.json_response({})
+        if not self._init_cruds():
+            return _json({})
         
-        from src.database.crud import SystemCRUD
-        crud = SystemCRUD(self.bot.db)
+        crud = self._system_crud
         
         if request.method == "POST":
             data = await request.json()
             for key, value in data.items():
                 await crud.set_global_setting(key, value)
-            return web.json_response({"status": "ok"})
+            return _json({"status": "ok"})
         else:
             limit = await crud.get_global_setting("max_concurrent_servers")
             # Also include Local AI global settings if present
             ai_enabled = await crud.get_global_setting("LOCAL_AI_ENABLED")
             ai_provider = await crud.get_global_setting("LOCAL_AI_PROVIDER")
-            return web.json_response({"max_concurrent_servers": limit, "LOCAL_AI_ENABLED": ai_enabled, "LOCAL_AI_PROVIDER": ai_provider})
+            return _json({"max_concurrent_servers": limit, "LOCAL_AI_ENABLED": ai_enabled, "LOCAL_AI_PROVIDER": ai_provider})
 
     async def _handle_ai_status(self, request: web.Request) -> web.Response:
         """Return Local AI backend availability and selected provider information."""
@@ -1273,9 +1478,8 @@ class DashboardCog(commands.Cog):
             status = await factory.status()
 
             # Merge persisted preference from global settings if available
-            if hasattr(self.bot, "db") and self.bot.db:
-                from src.database.crud import SystemCRUD
-                crud = SystemCRUD(self.bot.db)
+            if self._init_cruds():
+                crud = self._system_crud
                 pref = await crud.get_global_setting("LOCAL_AI_PROVIDER")
                 enabled = await crud.get_global_setting("LOCAL_AI_ENABLED")
                 # Persisted preferred provider (may be None)
@@ -1319,30 +1523,25 @@ class DashboardCog(commands.Cog):
                 "message": message,
             }
 
-            return web.json_response(out)
+            return _json(out)
         except Exception as e:
-            return web.json_response({"error": "failed", "message": str(e)}, status=500)
+            return _json({"error": "failed", "message": str(e)}, status=500)
 
     async def _handle_notifications(self, request: web.Request) -> web.Response:
         """Get notifications."""
-        if not hasattr(self.bot, "db"):
-            return web.json_response({"notifications": []})
+        if not self._init_cruds():
+            return _json({"notifications": []})
         
-        from src.database.crud import SystemCRUD
-        crud = SystemCRUD(self.bot.db)
-        notifications = await crud.get_recent_notifications()
-        # Serialize datetime
+        notifications = await self._system_crud.get_recent_notifications()
         # Serialize datetime
         data = []
-        from datetime import datetime
         for n in notifications:
             d = dict(n)
             # Handle SQLite string or datetime object
             if isinstance(n["created_at"], str):
                 try:
                     # Depending on how it's stored, it might be ISO format
-                    dt = datetime.fromisoformat(n["created_at"])
-                    d["created_at"] = dt.timestamp()
+                    d["created_at"] = _parse_iso_datetime(n["created_at"]).timestamp()
                 except ValueError:
                     d["created_at"] = 0
             elif isinstance(n["created_at"], datetime):
@@ -1350,7 +1549,7 @@ class DashboardCog(commands.Cog):
             else:
                 d["created_at"] = 0
             data.append(d)
-        return web.json_response({"notifications": data})
+        return _json({"notifications": data})
 
     async def _handle_leave_guild(self, request: web.Request) -> web.Response:
         """Force bot to leave a guild."""
@@ -1360,26 +1559,22 @@ class DashboardCog(commands.Cog):
             await guild.leave()
             
             # Log notification
-            if hasattr(self.bot, "db"):
-                from src.database.crud import SystemCRUD
-                crud = SystemCRUD(self.bot.db)
-                await crud.add_notification("info", f"Manually left server: {guild.name}")
+            if self._init_cruds():
+                await self._system_crud.add_notification("info", f"Manually left server: {guild.name}")
                 
-            return web.json_response({"status": "ok"})
-        return web.json_response({"error": "Guild not found"}, status=404)
+            return _json({"status": "ok"})
+        return _json({"error": "Guild not found"}, status=404)
 
     async def _handle_library(self, request: web.Request) -> web.Response:
         """Get unified song library."""
-        if not hasattr(self.bot, "db"):
-            return web.json_response({"library": []})
+        if not self._init_cruds():
+            return _json({"library": []})
         
         guild_id = request.query.get("guild_id")
         if guild_id:
             guild_id = int(guild_id)
             
-        from src.database.crud import LibraryCRUD
-        crud = LibraryCRUD(self.bot.db)
-        library = await crud.get_library(guild_id=guild_id)
+        library = await self._library_crud.get_library(guild_id=guild_id)
         
         # Omit verbose logging for API calls
         
@@ -1388,14 +1583,14 @@ class DashboardCog(commands.Cog):
             if "last_added" in entry and isinstance(entry["last_added"], datetime):
                 entry["last_added"] = entry["last_added"].isoformat()
                 
-        return web.json_response({"library": library})
+        return _json({"library": library})
 
     
     async def _handle_user_detail(self, request: web.Request) -> web.Response:
         """Get detailed info for a single user."""
         user_id = int(request.match_info["user_id"])
         if not hasattr(self.bot, "db"):
-            return web.json_response({"error": "No database"}, status=503)
+            return _json({"error": "No database"}, status=503)
 
         # Basic user info
         user = await self.bot.db.fetch_one(
@@ -1403,7 +1598,7 @@ class DashboardCog(commands.Cog):
             (user_id,),
         )
         if not user:
-            return web.json_response({"error": "User not found"}, status=404)
+            return _json({"error": "User not found"}, status=404)
 
         user_data = dict(user)
         user_data["id"] = str(user_data["id"])
@@ -1453,9 +1648,8 @@ class DashboardCog(commands.Cog):
         )
 
         # Top preferences
-        from src.database.crud import PreferenceCRUD
-        pref_crud = PreferenceCRUD(self.bot.db)
-        preferences = await pref_crud.get_all_preferences(user_id)
+        self._init_cruds()
+        preferences = await self._preference_crud.get_all_preferences(user_id)
 
         # Imported playlists
         playlists = await self.bot.db.fetch_all(
@@ -1469,7 +1663,7 @@ class DashboardCog(commands.Cog):
                 d["imported_at"] = d["imported_at"].isoformat()
             playlists_data.append(d)
 
-        return web.json_response({
+        return _json({
             "user": user_data,
             "stats": {
                 "plays": plays_row["count"] if plays_row else 0,
@@ -1484,20 +1678,19 @@ class DashboardCog(commands.Cog):
 
     async def _handle_user_prefs(self, request: web.Request) -> web.Response:
         user_id = int(request.match_info["user_id"])
-        if not hasattr(self.bot, "db"):
-            return web.json_response({})
+        if not self._init_cruds():
+            return _json({})
         
-        from src.database.crud import PreferenceCRUD
-        crud = PreferenceCRUD(self.bot.db)
-        prefs = await crud.get_all_preferences(user_id)
-        return web.json_response(prefs)
+        prefs = await self._preference_crud.get_all_preferences(user_id)
+        return _json(prefs)
     
     async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
         ws = web.WebSocketResponse()
         await ws.prepare(request)
         self.ws_manager.clients.add(ws)
-        for log in self.ws_manager.recent_logs:
-            await ws.send_json(log)
+        if self.ws_manager.recent_logs:
+            # Replay the backlog as one frame instead of one frame per entry.
+            await ws.send_json({"type": "log_batch", "logs": list(self.ws_manager.recent_logs)})
         try:
             async for _ in ws:
                 pass
@@ -1507,92 +1700,145 @@ class DashboardCog(commands.Cog):
 
     async def _handle_services_list(self, request: web.Request) -> web.Response:
         """Get list of services and their status."""
+        payload = self._services_bytes
+        if payload is None:
+            payload = self._services_bytes = self._build_services_payload()
+        return web.Response(
+            body=payload,
+            content_type="application/json",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    def _build_services_payload(self) -> bytes:
+        bot_status = b"online" if self.bot.is_ready() else b"starting"
+        return _SERVICES_TEMPLATE.replace(_SERVICES_UPTIME_SENTINEL, self._uptime_bytes()).replace(
+            _SERVICES_STATUS_SENTINEL, bot_status
+        )
+
+    async def _services_loop(self) -> None:
+        """Rebuild the services payload once a second so the handler just returns bytes."""
+        while True:
+            try:
+                self._services_bytes = self._build_services_payload()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.debug_cat(Category.SYSTEM, "dashboard_services_refresh_failed", error=str(e))
+            await asyncio.sleep(self.METRICS_SAMPLE_INTERVAL)
+
+    def _uptime_bytes(self) -> bytes:
+        """Formatted process uptime, memoized for a second across dashboard polls."""
+        now = asyncio.get_running_loop().time()
+        if now - self._uptime_cache_ts < 1.0:
+            return self._uptime_cache
+
         import psutil
         import time
-        
-        process = psutil.Process()
-        uptime_seconds = time.time() - process.create_time()
-        
+
+        # Process start time never changes; look it up once.
+        if self._process_create_time is None:
+            self._process_create_time = psutil.Process().create_time()
+        uptime_seconds = time.time() - self._process_create_time
+
         # Format uptime
-        days = int(uptime_seconds // 86400)
-        hours = int((uptime_seconds % 86400) // 3600)
-        mins = int((uptime_seconds % 3600) // 60)
+        days, rem = divmod(int(uptime_seconds), 86400)
+        hours, rem = divmod(rem, 3600)
+        mins = rem // 60
         if days > 0:
             uptime_str = f"{days}d {hours}h {mins}m"
         elif hours > 0:
             uptime_str = f"{hours}h {mins}m"
         else:
             uptime_str = f"{mins}m"
-        
-        services = [
-            {
-                "id": "bot",
-                "name": "Discord Bot",
-                "description": "Core Discord bot handling commands and audio playback",
-                "status": "online" if self.bot.is_ready() else "starting",
-                "uptime": uptime_str,
-                "restartable": True,
-            },
-            {
-                "id": "dashboard",
-                "name": "Dashboard API",
-                "description": "Web API for the dashboard",
-                "status": "online",
-                "uptime": uptime_str,
-                "restartable": False,
-            },
-        ]
-        
-        return web.json_response({"services": services})
+
+        self._uptime_cache = uptime_str.encode()
+        self._uptime_cache_ts = now
+        return self._uptime_cache
     
+    @staticmethod
+    def _read_container_name() -> str:
+        """Docker sets the container hostname to its short ID; read it once at startup."""
+        try:
+            name = Path("/etc/hostname").read_text(encoding="utf-8").strip()
+            if name:
+                return name
+        except OSError:
+            pass
+        return socket.gethostname()
+
+    async def _docker_request(self, method: str, path: str) -> tuple[int, bytes]:
+        """Send a body-less request to the Docker Engine API over its unix socket.
+
+        Requests are one-shot, so a raw HTTP/1.1 exchange replaces the aiohttp client.
+        On success only the status line is read; headers and body are skipped and
+        the socket is dropped. The body is only read for non-2xx statuses (for logging).
+        """
+        reader, writer = await asyncio.open_unix_connection(DOCKER_SOCKET_PATH)
+        try:
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\nHost: docker\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+            parts = status_line.split(None, 2)
+            status = int(parts[1]) if len(parts) >= 2 and parts[1].isdigit() else 0
+            body = b""
+            if not 200 <= status < 300:
+                body = (await reader.read()).split(b"\r\n\r\n", 1)[-1]
+            return status, body
+        finally:
+            writer.close()
+
     async def _handle_service_restart(self, request: web.Request) -> web.Response:
         """Restart a service."""
-        if not self._is_admin(request):
-            return web.json_response({"error": "unauthorized"}, status=401)
+        if not request["is_admin"]:
+            return _unauthorized()
         
         service_id = request.match_info["service_id"]
         
         if service_id == "bot":
+            # Only the first request restarts; concurrent ones are told it's pending.
+            if self._restart_latch.is_set():
+                return web.Response(body=_RESTART_PENDING_BODY, content_type="application/json")
+            self._restart_latch.set()
+
             log.event(Category.SYSTEM, "bot_restart_requested", source="dashboard_api")
             
             # Try Docker restart first
-            import os
-            import socket
-            import aiohttp
-            
-            if os.path.exists("/var/run/docker.sock"):
+            if self._has_docker_sock:
                 try:
-                    hostname = socket.gethostname()
-                    connector = aiohttp.UnixConnector(path="/var/run/docker.sock")
-                    async with aiohttp.ClientSession(connector=connector) as session:
-                        url = f"http://localhost/containers/{hostname}/restart"
-                        async with session.post(url) as resp:
-                            if resp.status == 204:
-                                log.event(Category.SYSTEM, "docker_restart_sent")
-                                return web.json_response({"status": "restarting", "method": "docker"})
-                            else:
-                                text = await resp.text()
-                                log.warning_cat(Category.SYSTEM, f"Docker restart failed: {resp.status} - {text}")
+                    status, body = await asyncio.wait_for(
+                        self._docker_request("POST", self._docker_restart_path),
+                        timeout=self.DOCKER_API_TIMEOUT,
+                    )
+                    if status == 204:
+                        log.event(Category.SYSTEM, "docker_restart_sent")
+                        return web.Response(body=_RESTART_DOCKER_BODY, content_type="application/json")
+                    else:
+                        text = body.decode("utf-8", errors="replace")
+                        log.warning_cat(Category.SYSTEM, f"Docker restart failed: {status} - {text}")
+                except asyncio.TimeoutError:
+                    log.warning_cat(Category.SYSTEM, "Docker restart timed out", timeout_s=self.DOCKER_API_TIMEOUT)
                 except Exception as e:
                     log.warning_cat(Category.SYSTEM, f"Failed to restart via Docker socket: {e}")
             
             # Fallback to process exit (supervisor/docker will restart)
             async def do_restart():
-                await asyncio.sleep(0.5)
-                try:
-                    await self.bot.close()
-                except Exception:
-                    pass
+                # Give the response a moment to flush, then exit hard. A graceful
+                # bot.close() waits on Discord's close handshake; the new process
+                # reconnects and replaces the stale session anyway.
+                await asyncio.sleep(0.1)
+                logging.shutdown()
                 os._exit(0)
             
-            asyncio.create_task(do_restart())
-            return web.json_response({"status": "restarting", "method": "process_exit"})
+            self._restart_task = asyncio.create_task(do_restart())
+            return web.Response(body=_RESTART_PROCESS_EXIT_BODY, content_type="application/json")
         
         elif service_id == "dashboard":
-            return web.json_response({"error": "Dashboard cannot restart itself"}, status=400)
+            return web.Response(body=_DASHBOARD_SELF_RESTART_BODY, status=400, content_type="application/json")
         
         else:
-            return web.json_response({"error": "Unknown service"}, status=404)
+            return web.Response(body=_UNKNOWN_SERVICE_BODY, status=404, content_type="application/json")
 
 
 async def setup(bot: commands.Bot):
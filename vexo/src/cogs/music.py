@@ -1,11 +1,18 @@
 import asyncio
 import logging
+import math
 import time
+import types
 import collections
+import functools
+import itertools
+import json
 import random
 import shlex
+import socket
+import sqlite3
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta, UTC
+from datetime import datetime, UTC
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -17,17 +24,38 @@ from src.services.youtube import YouTubeService, YTTrack, StreamInfo
 from src.services.enrichment_worker import EnrichmentWorker
 from src.services.metadata_enricher import MetadataEnricher
 from src.services.stream_resolver import StreamResolverWorker
-from src.database.crud import SongCRUD, UserCRUD, PlaybackCRUD, ReactionCRUD, GuildCRUD
+from src.config import config
+from src.database.crud import (
+    GuildCRUD,
+    LibraryCRUD,
+    PlaybackCRUD,
+    ReactionCRUD,
+    SongCRUD,
+    UserCRUD,
+)
 from src.utils.logging import get_logger, Category, Event
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 log = get_logger(__name__)
 
+# Normalize discovery source names for DB compatibility across schema versions.
+# Some older DBs used 'artist' and some used 'same_artist'.
+_DISCOVERY_SOURCE_MAP = {"same_artist": "artist"}
+_CHART_REGIONS = ("US", "UK")
+
 
 class MusicQueue:
     """A thread-safe-ish async queue that supports inserting at the front."""
-    def __init__(self):
+    def __init__(self, maxlen: int | None = None):
         self._items = collections.deque()
-        self._event = asyncio.Event()
+        self._maxlen = maxlen  # Hard cap; puts over capacity are rejected
+        # Created on first blocking get(); most puts/gets happen with no one waiting.
+        self._event: asyncio.Event | None = None
+        self._waiting = 0
 
     def empty(self):
         return len(self._items) == 0
@@ -35,34 +63,58 @@ class MusicQueue:
     def qsize(self):
         return len(self._items)
 
+    def peek(self):
+        """Next item without removing it, or None if empty (O(1))."""
+        return self._items[0] if self._items else None
+
+    def head(self, n: int) -> list:
+        """First ``n`` items without removing them; copies only those ``n``."""
+        return list(itertools.islice(self._items, n))
+
     def get_nowait(self):
         if not self._items:
             raise asyncio.QueueEmpty()
         item = self._items.popleft()
-        if not self._items:
+        if not self._items and self._event is not None:
             self._event.clear()
         return item
 
     async def get(self):
         while not self._items:
-            await self._event.wait()
+            if self._event is None:
+                self._event = asyncio.Event()
+            self._event.clear()
+            self._waiting += 1
+            try:
+                await self._event.wait()
+            finally:
+                self._waiting -= 1
         return self.get_nowait()
 
-    def put_nowait(self, item):
+    def _full(self) -> bool:
+        if self._maxlen and len(self._items) >= self._maxlen:
+            log.warning_cat(Category.QUEUE, "queue_overflow", qsize=len(self._items), maxlen=self._maxlen)
+            return True
+        return False
+
+    def put_nowait(self, item) -> bool:
+        if self._full():
+            return False
         self._items.append(item)
-        self._event.set()
+        if self._waiting:
+            self._event.set()
+        return True
 
-    async def put(self, item):
-        self.put_nowait(item)
+    async def put(self, item) -> bool:
+        return self.put_nowait(item)
 
-    def put_at_front(self, item):
+    def put_at_front(self, item) -> bool:
+        if self._full():
+            return False
         self._items.appendleft(item)
-        self._event.set()
-    
-    @property
-    def _queue(self):
-        """Compatibility with code that peeks at the internal deque."""
-        return self._items
+        if self._waiting:
+            self._event.set()
+        return True
 
 
 @dataclass
@@ -72,6 +124,8 @@ class QueueItem:
     title: str
     artist: str
     url: str | None = None  # Stream URL, resolved when needed
+    acodec: str | None = None  # Audio codec of the resolved stream (e.g. "opus")
+    resolved_stream: StreamInfo | None = field(default=None, repr=False)  # Full info when prefetched
     requester_id: int | None = None
     discovery_source: str = "user_request"
     discovery_reason: str | None = None
@@ -81,6 +135,12 @@ class QueueItem:
     duration_seconds: int | None = None
     genre: str | None = None
     year: int | None = None
+    # requester_id is set for /play and other explicit user queueing;
+    # discovery/autoplay items typically have requester_id=None.
+    is_user_requested: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.is_user_requested = bool(self.requester_id) or self.discovery_source == "user_request"
 
 
 @dataclass
@@ -88,7 +148,7 @@ class GuildPlayer:
     """Per-guild music player state."""
     guild_id: int
     voice_client: discord.VoiceClient | None = None
-    queue: MusicQueue = field(default_factory=MusicQueue)
+    queue: MusicQueue = field(default_factory=lambda: MusicQueue(maxlen=100))
     current: QueueItem | None = None
     session_id: str | None = None
     is_playing: bool = False
@@ -96,19 +156,27 @@ class GuildPlayer:
     volume: float = 1.0
     autoplay: bool = True
     pre_buffer: bool = True
-    last_activity: datetime = field(default_factory=lambda: datetime.now(UTC))
+    last_activity: float = field(default_factory=time.monotonic)  # time.monotonic() of last activity
     skip_votes: set = field(default_factory=set)
     _next_url: str | None = None  # Pre-buffered URL
     text_channel_id: int | None = None  # For Now Playing messages
     last_np_msg: discord.Message | None = None
-    start_time: datetime | None = None  # When current song started
-    _next_discovery: QueueItem | None = None  # Prefetched discovery song
+    start_time: float | None = None  # time.monotonic() when current song started
+    # Prefetched discovery songs as (monotonic expiry, QueueItem), oldest first
+    _discovery_buffer: collections.deque = field(default_factory=lambda: collections.deque(maxlen=3))
     _prefetch_task: asyncio.Task | None = None  # Background prefetch task
     _maintenance_task: asyncio.Task | None = None  # Task to keep queue filled
+    _refill_event: asyncio.Event = field(default_factory=asyncio.Event)  # Wakes the queue maintainer
+    _queue_filling: bool = False  # True while the maintainer is running a discovery fill
+    _discovery_misses: int = 0  # Consecutive discovery lookups that returned nothing
     _consecutive_failures: int = 0  # Track consecutive failures for auto-recovery
-    _last_health_check: datetime = field(default_factory=lambda: datetime.now(UTC))
+    _last_health_check: float = field(default_factory=time.monotonic)
+    _idle_handle: asyncio.TimerHandle | None = None  # Pending idle-disconnect check
+    _stuck_handle: asyncio.TimerHandle | None = None  # Fires if the play loop stops checking in
     _np_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-    _join_debounce: dict[int, datetime] = field(default_factory=dict)  # Track user join times for AI discovery
+    # (channel id, non-bot member ids) for the bot's channel; None until rebuilt after a voice change
+    _voice_member_ids: tuple[int, list[int]] | None = None
+    _join_debounce: dict[int, float] = field(default_factory=dict)  # time.monotonic() of user joins, for AI discovery
     _play_start_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     _current_source: discord.AudioSource | None = None
     _current_stream_info: StreamInfo | None = None
@@ -136,48 +204,94 @@ class MusicCog(commands.Cog):
         "-reconnect_delay_max 5"
     )
     FFMPEG_OPTIONS = "-vn -b:a 128k"
+    FFMPEG_BEFORE_TOKENS = tuple(shlex.split(FFMPEG_BEFORE_OPTIONS))  # Pre-split for exec-style argv
     
     IDLE_TIMEOUT = 300  # 5 minutes
+    STUCK_THRESHOLD = 300  # 5 minutes without health check update = stuck
     STREAM_FETCH_TIMEOUT = 30  # Max seconds to fetch stream URL
     PLAYBACK_TIMEOUT = 600  # Max seconds for a single song (10 min safety)
     DISCOVERY_TIMEOUT = 20  # Max seconds for discovery operation
-    MAX_CONSECUTIVE_FAILURES = 3  # Auto-restart playback loop after this many failures
+    MAX_CONSECUTIVE_FAILURES = 3  # Start backing off between retries after this many failures
+    MAX_FAILURES_BEFORE_STOP = 10  # Give up on the playback loop after this many in a row
     SPOTIFY_ENRICH_TIMEOUT = 6  # Seconds; runs in background to avoid delaying playback
+    SPOTIFY_ENRICH_CACHE_TTL = 24 * 3600  # Seconds; year/genre of a recording rarely change
+    SPOTIFY_ENRICH_CACHE_MAX = 2048
+    QUEUE_LOW_WATER = 2  # Refill the autoplay queue once it drops to this many items...
+    QUEUE_HIGH_WATER = 5  # ...and top it back up to this many
+    DISCOVERY_MISS_LIMIT = 3  # Consecutive empty discovery results before going straight to charts
+    DISCOVERY_PREFETCH_TTL = 900  # Seconds a prefetched discovery song (and its stream URL) stays usable
+    CHART_CACHE_TTL = 3600  # Seconds to reuse chart playlist/track lookups for the fallback
+    GUILD_SETTING_TTL = 60  # Seconds to reuse per-guild settings read on playback/discovery paths
+    DISPLAY_NAME_CACHE_TTL = 60  # Seconds to reuse a resolved requester/"song for" display name
+    DISPLAY_NAME_CACHE_MAX = 1024
+    ADDRINFO_CACHE_TTL = 300  # Seconds to reuse the radio presenter's resolved address
+    OBS_READ_CHUNK_SIZE = 65536  # Max bytes per relay read from ffmpeg stdout
+    OBS_STDOUT_BUFFER_LIMIT = 1024 * 1024  # StreamReader buffer for ffmpeg stdout
+    OBS_SUBSCRIBER_QUEUE_SIZE = 32  # MP3 chunks buffered per OBS listener before dropping oldest
 
     # Radio presenter / DJ intro announcement policy:
     # - Always announce user-requested tracks
     # - Otherwise announce randomly 1 in N tracks
     RADIO_PRESENTER_RANDOM_ANNOUNCE_DENOMINATOR = 5
-
-    @staticmethod
-    def _is_user_requested(item: QueueItem) -> bool:
-        # requester_id is set for /play and other explicit user queueing.
-        # discovery/autoplay items typically have requester_id=None.
-        return bool(item.requester_id) or item.discovery_source == "user_request"
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+    _PRESENTER_SETTING_KEYS = ("radio_presenter_enabled", "radio_presenter_voice")
 
     def _should_announce_radio_presenter(self, item: QueueItem) -> tuple[bool, str, int | None]:
-        if self._is_user_requested(item):
+        # Skip the roll entirely when the integration is off or unreachable.
+        if not self._presenter_url or self._radio_presenter_enabled is False:
+            return False, "disabled", None
+        if item.is_user_requested:
             return True, "user_requested", None
 
-        denom = max(1, int(self.RADIO_PRESENTER_RANDOM_ANNOUNCE_DENOMINATOR))
-        roll = random.randrange(denom)
-        return (roll == 0), f"random_1_in_{denom}", roll
+        roll = self._rng.randrange(self._announce_denom)
+        return (roll == 0), self._announce_reason, roll
     
     @staticmethod
-    def _build_ffmpeg_options(stream_info: StreamInfo, bitrate: int = 128) -> dict:
+    @functools.lru_cache(maxsize=32)
+    def _ffmpeg_before_options(ua: str | None, referer: str | None) -> str:
+        parts = []
+        if referer:
+            parts.append(f'-referer "{referer}"')
+        if ua:
+            parts.append(f'-user_agent "{ua}"')
+        parts.append(MusicCog.FFMPEG_BEFORE_OPTIONS)
+        return " ".join(parts)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _ffmpeg_output_options(bitrate: int) -> str:
+        return f"-vn -b:a {bitrate}k"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _ffmpeg_before_tokens(ua: str | None, referer: str | None) -> tuple[str, ...]:
+        """argv form of _ffmpeg_before_options; header values need no shell quoting here."""
+        before = MusicCog.FFMPEG_BEFORE_TOKENS
+        if ua:
+            before = ("-user_agent", ua) + before
+        if referer:
+            before = ("-referer", referer) + before
+        return before
+
+    @staticmethod
+    def _build_ffmpeg_tokens(http_headers: dict[str, str] | None, bitrate: int = 128) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """(before, after) FFmpeg argument tokens for spawning ffmpeg directly."""
+        headers = http_headers or {}
+        before = MusicCog._ffmpeg_before_tokens(headers.get("User-Agent"), headers.get("Referer"))
+        return before, ("-vn", "-b:a", f"{bitrate}k")
+
+    @staticmethod
+    def _build_ffmpeg_options(http_headers: dict[str, str] | None, bitrate: int = 128) -> dict:
         """Build FFmpeg options, injecting HTTP headers and bitrate."""
-        before = MusicCog.FFMPEG_BEFORE_OPTIONS
-        if stream_info.http_headers:
-            ua = stream_info.http_headers.get("User-Agent")
-            referer = stream_info.http_headers.get("Referer")
-            if ua:
-                before = f'-user_agent "{ua}" ' + before
-            if referer:
-                before = f'-referer "{referer}" ' + before
+        headers = http_headers
+        if headers:
+            before = MusicCog._ffmpeg_before_options(headers.get("User-Agent"), headers.get("Referer"))
+        else:
+            before = MusicCog.FFMPEG_BEFORE_OPTIONS
         
         return {
             "before_options": before, 
-            "options": f"-vn -b:a {bitrate}k"
+            "options": MusicCog._ffmpeg_output_options(bitrate)
         }
     
     async def _get_next_item(self, player: GuildPlayer) -> QueueItem | None:
@@ -221,33 +335,108 @@ class MusicCog(commands.Cog):
             
         # Regular discovery mode (not AI)
         # Use prefetched discovery song if available
-        if player._next_discovery:
-            item = player._next_discovery
-            player._next_discovery = None
-            return item
-            
-        # Try to get discovery song
-        guild_crud = GuildCRUD(self.bot.db) if hasattr(self.bot, "db") else None
-        max_seconds = 0
-        if guild_crud:
+        item = self._pop_prefetched_discovery(player)
+        if not item:
+            # Try to get discovery song
+            max_seconds = await self._get_max_seconds(player)
+
+            item = await asyncio.wait_for(
+                self._get_discovery_song_with_retry(player, max_seconds),
+                timeout=self.DISCOVERY_TIMEOUT
+            )
+            if item and self._is_pending(player, item.video_id):
+                log.debug_cat(Category.DISCOVERY, "discovery_pick_duplicate", title=item.title, target="next")
+                item = None
+
+        # Top the buffer back up only once the foreground pick is settled.
+        self._start_discovery_prefetch(player)
+        return item
+
+    def _start_discovery_prefetch(self, player: GuildPlayer) -> None:
+        """Refill the discovery buffer in the background unless a prefetch or queue fill is already running."""
+        if player._queue_filling:
+            return
+        if player._prefetch_task and not player._prefetch_task.done():
+            return
+        player._prefetch_task = self._spawn(self._prefetch_discovery_song(player))
+
+    async def _get_setting_cached(self, guild_id: int, key: str):
+        """Guild setting read through a GUILD_SETTING_TTL cache (misses are cached too)."""
+        now = time.monotonic()
+        hit = self._setting_cache.get((guild_id, key))
+        if hit and now < hit[0]:
+            return hit[1]
+
+        cruds = self._get_cruds()
+        if not cruds:
+            return None
+        value = await cruds.guild.get_setting(guild_id, key)
+        self._setting_cache[(guild_id, key)] = (now + self.GUILD_SETTING_TTL, value)
+        return value
+
+    async def _get_settings_cached(self, guild_id: int, keys: tuple[str, ...]) -> dict:
+        """Several guild settings through the same TTL cache, fetching all misses in one query."""
+        now = time.monotonic()
+        values = {}
+        missing = []
+        for key in keys:
+            hit = self._setting_cache.get((guild_id, key))
+            if hit and now < hit[0]:
+                values[key] = hit[1]
+            else:
+                missing.append(key)
+        if not missing:
+            return values
+
+        cruds = self._get_cruds()
+        if not cruds:
+            return values
+        fetched = await cruds.guild.get_settings(guild_id, missing)
+        for key in missing:
+            value = fetched.get(key)
+            self._setting_cache[(guild_id, key)] = (now + self.GUILD_SETTING_TTL, value)
+            values[key] = value
+        return values
+
+    async def _get_int_setting_cached(self, guild_id: int, key: str, default: int) -> int:
+        """Integer guild setting, parsed once per GUILD_SETTING_TTL rather than on every read."""
+        cache_key = (guild_id, f"{key}#int")
+        now = time.monotonic()
+        hit = self._setting_cache.get(cache_key)
+        if hit and now < hit[0]:
+            return hit[1]
+
+        value = default
+        raw = await self._get_setting_cached(guild_id, key)
+        if raw:
             try:
-                max_dur = await guild_crud.get_setting(player.guild_id, "max_song_duration")
-                if max_dur:
-                    max_seconds = int(max_dur) * 60
-            except: pass
-            
-        return await asyncio.wait_for(
-            self._get_discovery_song_with_retry(player, max_seconds),
-            timeout=self.DISCOVERY_TIMEOUT
-        )
+                value = int(raw)
+            except (TypeError, ValueError) as e:
+                log.debug_cat(Category.DATABASE, "setting_not_int", guild_id=guild_id, key=key, error=str(e))
+        self._setting_cache[cache_key] = (now + self.GUILD_SETTING_TTL, value)
+        return value
+
+    async def _get_max_seconds(self, player: GuildPlayer) -> int:
+        """Guild max_song_duration in seconds (0 = no limit)."""
+        try:
+            return await self._get_int_setting_cached(player.guild_id, "max_song_duration", 0) * 60
+        except sqlite3.Error as e:
+            log.debug_cat(Category.DATABASE, "get_setting_failed", guild_id=player.guild_id, key="max_song_duration", error=str(e))
+        return 0
+
+    def invalidate_guild_settings(self, guild_id: int) -> None:
+        """Drop cached settings for a guild so the next read hits the database."""
+        for key in [k for k in self._setting_cache if k[0] == guild_id]:
+            del self._setting_cache[key]
 
     async def _ensure_session(self, player: GuildPlayer):
         """Ensure guild and session exist in database."""
-        if not hasattr(self.bot, "db") or not self.bot.db:
+        cruds = self._get_cruds()
+        if cruds is None:
             return
-            
-        playback_crud = PlaybackCRUD(self.bot.db)
-        guild_crud = GuildCRUD(self.bot.db)
+
+        playback_crud = cruds.playback
+        guild_crud = cruds.guild
         
         if not player.session_id:
             if player.voice_client and player.voice_client.guild:
@@ -264,36 +453,54 @@ class MusicCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.players: dict[int, GuildPlayer] = {}
+        # Bot services are created in setup_hook before cogs load; snapshot them once.
+        self._db = getattr(bot, "db", None) or None
+        self._spotify = getattr(bot, "spotify", None) or None
+        self._discovery = getattr(bot, "discovery", None) or None
+        self._ai_client = getattr(bot, "ai_client", None) or None
         self.youtube = getattr(bot, "youtube", None) or YouTubeService()
         self.metadata_enricher = MetadataEnricher()
         self.enrichment = EnrichmentWorker(self.youtube, concurrency=2, metadata_enricher=self.metadata_enricher)
         self.stream_resolver = StreamResolverWorker(self.youtube, concurrency=2)
-        self._idle_check_task: asyncio.Task | None = None
         self._radio_presenter_task: asyncio.Task | None = None
         self._radio_presenter_enabled: bool | None = None  # unknown until checked
-        self._radio_presenter_disabled_until: datetime | None = None
+        self._presenter_url: str | None = getattr(config, "RADIO_PRESENTER_API_URL", None) or None
+        self._presenter_voice: str | None = getattr(config, "RADIO_PRESENTER_VOICE", None) or None
+        self._radio_presenter_disabled_until: float | None = None  # time.monotonic() deadline
         self._radio_presenter_last_error: str | None = None
+        self._rng = random.Random()  # Announce rolls; independent of the module-level generator
+        self._announce_denom = max(1, int(self.RADIO_PRESENTER_RANDOM_ANNOUNCE_DENOMINATOR))
+        self._announce_reason = f"random_1_in_{self._announce_denom}"
         self._background_tasks_started: bool = False
+        self._obs_enabled_flag: bool = bool(getattr(config, "OBS_AUDIO_ENABLED", False))  # Env config; fixed per process
         self._obs_audio_subscribers: set[asyncio.Queue[bytes]] = set()
+        # Copy-on-write snapshot of the set for the relay loop; rebuilt under the lock on (un)subscribe.
+        self._obs_audio_subscribers_tuple: tuple[asyncio.Queue[bytes], ...] = ()
         self._obs_relay_lock = asyncio.Lock()
         self._obs_relay_task: asyncio.Task | None = None
         self._obs_relay_process: asyncio.subprocess.Process | None = None
         self._obs_relay_guild_id: int | None = None
+        self._obs_dropped_chunks: int = 0
+        self._http_session: aiohttp.ClientSession | None = None
+        self._bg_tasks: set[asyncio.Task] = set()  # Strong refs for fire-and-forget tasks
+        self._cruds: types.SimpleNamespace | None = self._build_cruds(self._db) if self._db is not None else None
+        # True while the DB is available to this cog; cleared on unload before teardown.
+        self._persistence_enabled = self._cruds is not None
+        self._addrinfo_cache: dict[tuple[str, int], tuple[float, list]] = {}
+        self._display_name_cache: dict[tuple[int, int], tuple[float, str | None]] = {}  # (guild, user) -> (expires, name)
+        self._setting_cache: dict[tuple[int, str], tuple[float, object]] = {}  # (guild, key) -> (expires, value)
+        self._chart_cache: dict[str, tuple[float, list]] = {}  # lookup key -> (expires, results)
+        # (artist, title) lowercased -> (expires, year, genre); misses are cached as (None, None)
+        self._spotify_enrich_cache: dict[tuple[str, str], tuple[float, Optional[int], Optional[str]]] = {}
 
     def _start_background_tasks(self, *, reason: str) -> None:
         if self._background_tasks_started:
             return
         self._background_tasks_started = True
 
-        if not self._idle_check_task or self._idle_check_task.done():
-            self._idle_check_task = asyncio.create_task(self._idle_check_loop())
-            log.info_cat(Category.SYSTEM, "idle_check_loop_started", reason=reason)
-
         # Radio presenter health check loop (optional)
         try:
-            from src.config import config
-
-            url = getattr(config, "RADIO_PRESENTER_API_URL", None)
+            url = self._presenter_url
             if not url:
                 log.info_cat(Category.API, "radio_presenter_disabled", reason="no_url", started_by=reason)
                 return
@@ -303,18 +510,19 @@ class MusicCog(commands.Cog):
                 self._radio_presenter_task = asyncio.create_task(self._radio_presenter_health_loop())
                 log.info_cat(Category.API, "radio_presenter_health_loop_scheduled", url=url)
             # Kick an immediate check so logs show status right after startup/reload.
-            asyncio.create_task(self._radio_presenter_check_once())
+            self._spawn(self._radio_presenter_check_once())
         except Exception as e:
             log.warning_cat(Category.API, "radio_presenter_init_failed", error=str(e), started_by=reason)
 
     async def cog_load(self):
         """Called when the cog is loaded."""
         self._start_background_tasks(reason="cog_load")
+        self._get_http_session()
         await self.enrichment.start()
         await self.stream_resolver.start()
-        if hasattr(self.bot, "discovery") and self.bot.discovery:
+        if self._discovery is not None:
             try:
-                set_worker = getattr(self.bot.discovery, "set_enrichment_worker", None)
+                set_worker = getattr(self._discovery, "set_enrichment_worker", None)
                 if callable(set_worker):
                     set_worker(self.enrichment)
             except Exception:
@@ -329,27 +537,69 @@ class MusicCog(commands.Cog):
     
     async def cog_unload(self):
         """Called when the cog is unloaded."""
-        if self._idle_check_task:
-            self._idle_check_task.cancel()
+        self._persistence_enabled = False
+        for player in self.players.values():
+            for handle in (player._idle_handle, player._stuck_handle):
+                if handle:
+                    handle.cancel()
         if self._radio_presenter_task:
             self._radio_presenter_task.cancel()
         await self.enrichment.stop()
         await self.stream_resolver.stop()
         await self._stop_obs_relay()
         self._background_tasks_started = False
+        for task in list(self._bg_tasks):
+            task.cancel()
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
 
-        # Disconnect from all voice channels
-        for player in self.players.values():
+        # Disconnect from all voice channels (snapshot: voice events can mutate the map between awaits)
+        for player in tuple(self.players.values()):
             if player.voice_client:
                 await player.voice_client.disconnect(force=True)
         
         log.event(Category.SYSTEM, Event.COG_UNLOADED, cog="music")
 
+    def _spawn(self, coro) -> asyncio.Task:
+        """create_task that keeps a reference until the task finishes (the loop only holds a weak one)."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    @staticmethod
+    def _build_cruds(db) -> types.SimpleNamespace:
+        """CRUD wrappers are stateless over bot.db; built once per cog."""
+        return types.SimpleNamespace(
+            db=db,
+            guild=GuildCRUD(db),
+            playback=PlaybackCRUD(db),
+            song=SongCRUD(db),
+            user=UserCRUD(db),
+            library=LibraryCRUD(db),
+            reaction=ReactionCRUD(db),
+        )
+
+    def _get_cruds(self) -> types.SimpleNamespace | None:
+        """Shared CRUD wrappers, or None when persistence is unavailable."""
+        return self._cruds if self._persistence_enabled else None
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Shared client session so outbound notifies reuse keep-alive connections."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=3),
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60),
+            )
+        return self._http_session
+
     def get_player(self, guild_id: int) -> GuildPlayer:
         """Get or create a player for a guild."""
-        if guild_id not in self.players:
-            self.players[guild_id] = GuildPlayer(guild_id=guild_id)
-        return self.players[guild_id]
+        player = self.players.get(guild_id)
+        if player is None:
+            player = self.players[guild_id] = GuildPlayer(guild_id=guild_id)
+        return player
 
     async def ensure_play_loop(self, player: GuildPlayer, *, reason: str) -> bool:
         """Start playback loop once per guild; no-op if one is already active."""
@@ -371,31 +621,18 @@ class MusicCog(commands.Cog):
             return value.strip().lower() in {"1", "true", "yes", "on"}
         return bool(value)
 
-    async def _guild_bool_setting(self, guild_id: int, key: str, default: bool = True) -> bool:
-        if not hasattr(self.bot, "db") or not self.bot.db:
-            return default
-        try:
-            guild_crud = GuildCRUD(self.bot.db)
-            value = await guild_crud.get_setting(guild_id, key)
-            return self._as_bool(value, default)
-        except Exception:
-            return default
-
     def _obs_enabled(self) -> bool:
-        try:
-            from src.config import config
-            return bool(getattr(config, "OBS_AUDIO_ENABLED", False))
-        except Exception:
-            return False
+        return self._obs_enabled_flag
 
     async def subscribe_obs_audio(self) -> asyncio.Queue[bytes] | None:
         """Register an OBS audio subscriber queue."""
         if not self._obs_enabled():
             return None
 
-        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=128)
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self.OBS_SUBSCRIBER_QUEUE_SIZE)
         async with self._obs_relay_lock:
             self._obs_audio_subscribers.add(queue)
+            self._obs_audio_subscribers_tuple = tuple(self._obs_audio_subscribers)
         await self._ensure_obs_relay_state()
         return queue
 
@@ -403,6 +640,7 @@ class MusicCog(commands.Cog):
         """Remove an OBS audio subscriber queue."""
         async with self._obs_relay_lock:
             self._obs_audio_subscribers.discard(queue)
+            self._obs_audio_subscribers_tuple = tuple(self._obs_audio_subscribers)
         await self._ensure_obs_relay_state()
 
     async def get_obs_audio_status(self) -> dict:
@@ -417,6 +655,7 @@ class MusicCog(commands.Cog):
             "listeners": listener_count,
             "relay_running": relay_running,
             "relay_guild_id": relay_guild_id,
+            "dropped_chunks": self._obs_dropped_chunks,
         }
 
     async def _stop_obs_relay(self) -> None:
@@ -450,21 +689,18 @@ class MusicCog(commands.Cog):
 
     async def _pick_obs_source_player(self) -> GuildPlayer | None:
         """Choose one active guild player as OBS source."""
-        candidates = []
+        # Single pass: most recently started eligible player wins.
+        best = None
+        best_start = -math.inf
         for player in self.players.values():
-            if not player.current or not player._current_stream_info:
+            if not player.current or not player.current.url:
                 continue
             if not player.voice_client or not player.voice_client.is_connected():
                 continue
-            candidates.append(player)
-
-        if not candidates:
-            return None
-
-        return max(
-            candidates,
-            key=lambda p: p.start_time or datetime.min.replace(tzinfo=UTC),
-        )
+            start = player.start_time or -math.inf
+            if best is None or start > best_start:
+                best, best_start = player, start
+        return best
 
     async def _ensure_obs_relay_state(self) -> None:
         """Start/stop relay based on listeners and active playback."""
@@ -483,10 +719,8 @@ class MusicCog(commands.Cog):
             await self._stop_obs_relay()
             return
 
-        source_info = source_player._current_stream_info
-        if not source_info:
-            await self._stop_obs_relay()
-            return
+        # Pre-buffered tracks carry only a URL; build the StreamInfo just for the relay.
+        source_info = source_player._current_stream_info or StreamInfo(url=source_player.current.url)
 
         async with self._obs_relay_lock:
             same_guild = self._obs_relay_guild_id == source_player.guild_id
@@ -518,18 +752,18 @@ class MusicCog(commands.Cog):
 
     async def _run_obs_relay(self, guild_id: int, stream_info: StreamInfo) -> None:
         """Run FFmpeg that transcodes current track to MP3 and fanouts to HTTP subscribers."""
-        from src.config import config
-
-        ffmpeg_opts = self._build_ffmpeg_options(stream_info, bitrate=max(32, int(config.OBS_AUDIO_BITRATE_KBPS)))
+        before_tokens, after_tokens = self._build_ffmpeg_tokens(
+            stream_info.http_headers, bitrate=max(32, int(config.OBS_AUDIO_BITRATE_KBPS))
+        )
         cmd = [
             "ffmpeg",
             "-hide_banner",
             "-loglevel",
             "error",
-            *shlex.split(ffmpeg_opts["before_options"]),
+            *before_tokens,
             "-i",
             stream_info.url,
-            *shlex.split(ffmpeg_opts["options"]),
+            *after_tokens,
             "-f",
             "mp3",
             "pipe:1",
@@ -537,33 +771,41 @@ class MusicCog(commands.Cog):
 
         proc: asyncio.subprocess.Process | None = None
         stderr_task: asyncio.Task | None = None
+        # ffmpeg stderr is only ever logged at debug; don't pipe and drain it otherwise.
+        capture_stderr = log.isEnabledFor(logging.DEBUG)
         try:
             proc = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL,
+                limit=self.OBS_STDOUT_BUFFER_LIMIT,
             )
             async with self._obs_relay_lock:
                 self._obs_relay_process = proc
 
-            stderr_task = asyncio.create_task(self._drain_obs_stderr(proc, guild_id))
+            if capture_stderr:
+                stderr_task = asyncio.create_task(self._drain_obs_stderr(proc, guild_id))
             log.info_cat(Category.API, "obs_relay_started", guild_id=guild_id)
 
             while True:
                 if not proc.stdout:
                     break
-                chunk = await proc.stdout.read(4096)
+                # read() returns whatever is buffered (up to the cap), so a big cap batches
+                # bursts into fewer fan-out passes without waiting to fill a block.
+                chunk = await proc.stdout.read(self.OBS_READ_CHUNK_SIZE)
                 if not chunk:
                     break
 
-                async with self._obs_relay_lock:
-                    subscribers = list(self._obs_audio_subscribers)
+                # Lock-free: writers swap in a new tuple, so this read is always consistent.
+                subscribers = self._obs_audio_subscribers_tuple
 
+                # Slow listeners lose their oldest chunks so playback stays near real-time.
                 for queue in subscribers:
                     try:
                         if queue.full():
                             try:
                                 queue.get_nowait()
+                                self._obs_dropped_chunks += 1
                             except asyncio.QueueEmpty:
                                 pass
                         queue.put_nowait(chunk)
@@ -602,13 +844,14 @@ class MusicCog(commands.Cog):
 
     async def _log_track_start(self, player: GuildPlayer, item: QueueItem) -> int | None:
         """Log track start to database and update library."""
-        if not hasattr(self.bot, "db") or not self.bot.db:
+        cruds = self._get_cruds()
+        if cruds is None:
             return None
             
         try:
-            playback_crud = PlaybackCRUD(self.bot.db)
-            song_crud = SongCRUD(self.bot.db)
-            user_crud = UserCRUD(self.bot.db)
+            playback_crud = cruds.playback
+            song_crud = cruds.song
+            user_crud = cruds.user
 
             # Check Song Existence and Persistence Policy
             if not item.song_db_id:
@@ -645,19 +888,46 @@ class MusicCog(commands.Cog):
                 for_user_id=target_user_id
             )
 
-            # Update Library
+            # Update Library (not needed to start playback)
             if item.discovery_source == "user_request" and target_user_id:
-                from src.database.crud import LibraryCRUD
-                lib_crud = LibraryCRUD(self.bot.db)
-                await lib_crud.add_to_library(target_user_id, item.song_db_id, "request")
+                self._spawn(self._add_to_library(target_user_id, item.song_db_id))
             
             return history_id
         except Exception as e:
             log.error_cat(Category.DATABASE, "Failed to log playback start", error=str(e))
             return None
 
+    async def _start_track_records(self, player: GuildPlayer, item: QueueItem) -> int | None:
+        """Ensure the session row exists, then log the track start; returns the history id."""
+        try:
+            await self._ensure_session(player)
+        except Exception as e:
+            log.error_cat(Category.DATABASE, "Failed to ensure playback session", error=str(e))
+        return await self._log_track_start(player, item)
+
+    async def _settle_failed_track_records(self, db_task: asyncio.Task) -> None:
+        """Wait out the history task of a track that never started and mark its row skipped."""
+        try:
+            history_id = await db_task
+            cruds = self._get_cruds()
+            if cruds and history_id:
+                await cruds.playback.mark_completed(history_id, False, skip_reason="error")
+        except Exception as e:
+            log.debug_cat(Category.DATABASE, "Failed to settle history for unplayed track", error=str(e))
+
+    async def _add_to_library(self, user_id: int, song_id: int) -> None:
+        cruds = self._get_cruds()
+        if cruds is None:
+            return
+        try:
+            await cruds.library.add_to_library(user_id, song_id, "request")
+        except Exception as e:
+            log.error_cat(Category.DATABASE, "Failed to add song to library", error=str(e))
+
     async def _resolve_stream(self, item: QueueItem) -> StreamInfo | None:
         """Resolve stream URL for an item with timeout."""
+        if item.resolved_stream:
+            return item.resolved_stream
         try:
             return await asyncio.wait_for(
                 self.stream_resolver.get_stream_url(item.video_id, timeout_s=self.STREAM_FETCH_TIMEOUT),
@@ -673,24 +943,28 @@ class MusicCog(commands.Cog):
     async def _notify_radio_presenter(self, player: GuildPlayer, item: QueueItem) -> None:
         """Notify external radio-presenter/TTS service that a song is starting."""
         try:
-            if not await self._guild_bool_setting(player.guild_id, "radio_presenter_enabled", True):
+            settings = {}
+            if self._get_cruds() is not None:
+                try:
+                    settings = await self._get_settings_cached(player.guild_id, self._PRESENTER_SETTING_KEYS)
+                except sqlite3.Error as e:
+                    log.debug_cat(Category.DATABASE, "get_setting_failed", guild_id=player.guild_id, key="radio_presenter", error=str(e))
+            if not self._as_bool(settings.get("radio_presenter_enabled"), True):
                 log.debug_cat(Category.API, "radio_presenter_notify_skipped", reason="guild_disabled", guild_id=player.guild_id)
                 return
 
-            from src.config import config
-
-            url = getattr(config, "RADIO_PRESENTER_API_URL", None)
+            url = self._presenter_url
             if not url:
                 log.debug_cat(Category.API, "radio_presenter_notify_skipped", reason="no_url")
                 return
 
-            now = datetime.now(UTC)
+            now = time.monotonic()
             if self._radio_presenter_disabled_until and now < self._radio_presenter_disabled_until:
                 log.debug_cat(
                     Category.API,
                     "radio_presenter_notify_skipped",
                     reason="disabled_until",
-                    disabled_until=self._radio_presenter_disabled_until.isoformat(),
+                    disabled_for_s=int(self._radio_presenter_disabled_until - now),
                     url=url,
                 )
                 return
@@ -700,7 +974,7 @@ class MusicCog(commands.Cog):
                 ok = await self._radio_presenter_can_connect(url)
                 self._radio_presenter_enabled = ok
                 if not ok:
-                    self._radio_presenter_disabled_until = now + timedelta(seconds=300)
+                    self._radio_presenter_disabled_until = now + 300
                     self._radio_presenter_last_error = "initial_connect_failed"
                     log.warning_cat(
                         Category.API,
@@ -715,35 +989,19 @@ class MusicCog(commands.Cog):
                 log.debug_cat(Category.API, "radio_presenter_notify_skipped", reason="unreachable", url=url)
                 return
 
+            vc = player.voice_client
+            guild = vc.guild if vc else None
             voice_channel_id = None
-            if player.voice_client and getattr(player.voice_client, "channel", None):
-                voice_channel_id = player.voice_client.channel.id
-
-            requested_by = None
-            if item.requester_id and player.voice_client and player.voice_client.guild:
-                member = player.voice_client.guild.get_member(item.requester_id)
-                requested_by = member.display_name if member else None
-            if requested_by is None and item.requester_id:
-                u = self.bot.get_user(item.requester_id)
-                requested_by = u.display_name if u else None
-
-            song_for = None
-            if item.for_user_id and player.voice_client and player.voice_client.guild:
-                member = player.voice_client.guild.get_member(item.for_user_id)
-                song_for = member.display_name if member else None
-            if song_for is None and item.for_user_id:
-                u = self.bot.get_user(item.for_user_id)
-                song_for = u.display_name if u else None
-
-            voice_id = getattr(config, "RADIO_PRESENTER_VOICE", None) or None
-            if hasattr(self.bot, "db") and self.bot.db:
-                try:
-                    guild_crud = GuildCRUD(self.bot.db)
-                    setting = await guild_crud.get_setting(player.guild_id, "radio_presenter_voice")
-                    if setting:
-                        voice_id = str(setting).strip() or voice_id
-                except Exception:
-                    pass
+            if vc and getattr(vc, "channel", None):
+                voice_channel_id = vc.channel.id
+
+            requested_by = self._resolve_display_name(guild, item.requester_id)
+            song_for = self._resolve_display_name(guild, item.for_user_id)
+
+            voice_id = self._presenter_voice
+            setting = settings.get("radio_presenter_voice")
+            if setting:
+                voice_id = str(setting).strip() or voice_id
 
             payload = {
                 "song_name": item.title,
@@ -764,46 +1022,46 @@ class MusicCog(commands.Cog):
                 artist=item.artist,
             )
             t0 = time.perf_counter()
-            timeout = aiohttp.ClientTimeout(total=3)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=payload) as resp:
-                    body = None
-                    try:
-                        body = await resp.text()
-                    except Exception:
-                        await resp.read()
-                    ms = int((time.perf_counter() - t0) * 1000)
-                    if 200 <= resp.status < 300:
-                        self._radio_presenter_enabled = True
-                        self._radio_presenter_last_error = None
-                        log.info_cat(
-                            Category.API,
-                            "radio_presenter_notified",
-                            guild_id=player.guild_id,
-                            status=resp.status,
-                            ms=ms,
-                            song=item.title,
-                            artist=item.artist,
-                        )
-                    else:
-                        self._radio_presenter_enabled = False
-                        self._radio_presenter_disabled_until = datetime.now(UTC) + timedelta(seconds=300)
-                        self._radio_presenter_last_error = f"http_{resp.status}"
-                        log.warning_cat(
-                            Category.API,
-                            "radio_presenter_disabled",
-                            guild_id=player.guild_id,
-                            reason=f"http_{resp.status}",
-                            disabled_for_s=300,
-                            ms=ms,
-                            url=url,
-                            response=(body[:500] if isinstance(body, str) else None),
-                            song=item.title,
-                            artist=item.artist,
-                        )
+            data = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+            async with self._get_http_session().post(url, data=data, headers=self._JSON_HEADERS) as resp:
+                # Always drain the (small) body so the keep-alive connection goes back to the pool.
+                body = None
+                try:
+                    body = await resp.text()
+                except Exception:
+                    pass
+                ms = int((time.perf_counter() - t0) * 1000)
+                if 200 <= resp.status < 300:
+                    self._radio_presenter_enabled = True
+                    self._radio_presenter_last_error = None
+                    log.info_cat(
+                        Category.API,
+                        "radio_presenter_notified",
+                        guild_id=player.guild_id,
+                        status=resp.status,
+                        ms=ms,
+                        song=item.title,
+                        artist=item.artist,
+                    )
+                else:
+                    self._radio_presenter_enabled = False
+                    self._radio_presenter_disabled_until = time.monotonic() + 300
+                    self._radio_presenter_last_error = f"http_{resp.status}"
+                    log.warning_cat(
+                        Category.API,
+                        "radio_presenter_disabled",
+                        guild_id=player.guild_id,
+                        reason=f"http_{resp.status}",
+                        disabled_for_s=300,
+                        ms=ms,
+                        url=url,
+                        response=(body[:500] if isinstance(body, str) else None),
+                        song=item.title,
+                        artist=item.artist,
+                    )
         except Exception as e:
             self._radio_presenter_enabled = False
-            self._radio_presenter_disabled_until = datetime.now(UTC) + timedelta(seconds=300)
+            self._radio_presenter_disabled_until = time.monotonic() + 300
             self._radio_presenter_last_error = str(e)
             log.warning_cat(
                 Category.API,
@@ -813,6 +1071,29 @@ class MusicCog(commands.Cog):
                 song=getattr(item, "title", None),
             )
 
+    def _resolve_display_name(self, guild: discord.Guild | None, uid: int | None) -> str | None:
+        """Display name for a user id, preferring the guild member over the global user."""
+        if not uid:
+            return None
+        key = (guild.id if guild else 0, uid)
+        now = time.monotonic()
+        hit = self._display_name_cache.get(key)
+        if hit and now < hit[0]:
+            return hit[1]
+
+        target = (guild.get_member(uid) if guild else None) or self.bot.get_user(uid)
+        name = target.display_name if target else None
+        cache = self._display_name_cache
+        if len(cache) >= self.DISPLAY_NAME_CACHE_MAX and key not in cache:
+            cache.pop(next(iter(cache)))
+        cache[key] = (now + self.DISPLAY_NAME_CACHE_TTL, name)
+        return name
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        # Nickname changes should show up in the next announcement, not after the TTL.
+        self._display_name_cache.pop((after.guild.id, after.id), None)
+
     async def _radio_presenter_can_connect(self, url: str) -> bool:
         """Check if the radio presenter host/port is reachable via TCP."""
         try:
@@ -821,18 +1102,34 @@ class MusicCog(commands.Cog):
             port = parsed.port or (443 if parsed.scheme == "https" else 80)
             if not host:
                 return False
+        except Exception:
+            return False
 
-            async def _probe():
-                reader, writer = await asyncio.open_connection(host, port)
-                writer.close()
-                try:
-                    await writer.wait_closed()
-                except Exception:
-                    pass
+        loop = asyncio.get_running_loop()
+        key = (host, port)
 
+        async def _probe():
+            # Plain TCP connect to a cached address: no DNS per tick and no TLS handshake.
+            cached = self._addrinfo_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                infos = cached[1]
+            else:
+                infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+                self._addrinfo_cache[key] = (time.monotonic() + self.ADDRINFO_CACHE_TTL, infos)
+            family, type_, proto, _, sockaddr = infos[0]
+            sock = socket.socket(family, type_, proto)
+            sock.setblocking(False)
+            try:
+                await loop.sock_connect(sock, sockaddr)
+            finally:
+                sock.close()
+
+        try:
             await asyncio.wait_for(_probe(), timeout=1.5)
             return True
         except Exception:
+            # Re-resolve next time in case the host moved.
+            self._addrinfo_cache.pop(key, None)
             return False
 
     async def _radio_presenter_health_loop(self) -> None:
@@ -842,9 +1139,7 @@ class MusicCog(commands.Cog):
         first = True
         while True:
             try:
-                from src.config import config
-
-                url = getattr(config, "RADIO_PRESENTER_API_URL", None)
+                url = self._presenter_url
                 if not url:
                     self._radio_presenter_enabled = None
                     await asyncio.sleep(30)
@@ -875,9 +1170,7 @@ class MusicCog(commands.Cog):
     async def _radio_presenter_check_once(self) -> None:
         """One-shot health check for visibility on startup/reload."""
         try:
-            from src.config import config
-
-            url = getattr(config, "RADIO_PRESENTER_API_URL", None)
+            url = self._presenter_url
             if not url:
                 log.info_cat(Category.API, "radio_presenter_check_skipped", reason="no_url")
                 return
@@ -900,14 +1193,19 @@ class MusicCog(commands.Cog):
         if not player._maintenance_task or player._maintenance_task.done():
             player._maintenance_task = asyncio.create_task(self._maintain_queue(player))
 
+        # Loop-invariant lookups, bound once.
+        loop = self.bot.loop
+        spawn = self._spawn
+        queue = player.queue
+
         try:
             while player.voice_client and player.voice_client.is_connected():
                 player.skip_votes.clear()
-                player._last_health_check = datetime.now(UTC)
+                self._arm_stuck_timer(player)
                 
                 # 1. Get next item from queue (or AI autoplay when enabled)
                 try:
-                    if player.queue.empty():
+                    if queue.empty():
                         if not player.autoplay:
                             break
 
@@ -917,7 +1215,8 @@ class MusicCog(commands.Cog):
                             await asyncio.sleep(1.0)
                             continue
                     else:
-                        item = await asyncio.wait_for(player.queue.get(), timeout=10.0)
+                        # Queue is non-empty here, so this never blocks; no timer needed.
+                        item = queue.get_nowait()
                 except (asyncio.TimeoutError, asyncio.QueueEmpty):
                     continue
                 except Exception as e:
@@ -925,56 +1224,84 @@ class MusicCog(commands.Cog):
                     break
 
                 player.current = item
-                player.last_activity = datetime.now(UTC)
+                player.last_activity = time.monotonic()
                 
-                # 2. Database: Ensure session and log playback
-                await self._ensure_session(player)
-                item.history_id = await self._log_track_start(player, item)
-
-                # 3. Get stream URL (if not already prefetched)
+                # 2. Get stream URL (if not already prefetched)
                 if not item.url:
                     stream_info = await self._resolve_stream(item)
                     if not stream_info:
                         player._consecutive_failures += 1
+                        failures = player._consecutive_failures
+                        if failures >= self.MAX_FAILURES_BEFORE_STOP:
+                            log.error_cat(
+                                Category.PLAYBACK,
+                                "Too many consecutive stream failures - stopping playback loop",
+                                guild_id=player.guild_id,
+                                failures=failures,
+                            )
+                            break
+                        if failures >= self.MAX_CONSECUTIVE_FAILURES:
+                            # Back off instead of hammering YouTube while it is failing.
+                            await asyncio.sleep(min(60, 2 ** failures))
                         continue
                     item.url = stream_info.url
+                    item.acodec = stream_info.acodec
                 else:
-                    stream_info = StreamInfo(url=item.url)
+                    # Prefetched in the background; the URL alone (no headers) if only that is known.
+                    stream_info = item.resolved_stream
 
                 player._current_stream_info = stream_info
 
                 player._consecutive_failures = 0
 
+                # 3. Database: Ensure session and log playback. Started only once the stream
+                # is in hand, then runs alongside FFmpeg startup; history_id is bound once audio starts.
+                db_task = spawn(self._start_track_records(player, item))
+
                 # 4. Prefetch next song's URL if it's already in queue
-                if player.pre_buffer and not player.queue.empty():
-                    asyncio.create_task(self._pre_buffer_next(player))
+                if player.pre_buffer and not queue.empty():
+                    spawn(self._pre_buffer_next(player))
 
                 # 5. Play the audio
                 try:
-                    if player.voice_client.is_playing() or player.voice_client.is_paused():
+                    # Bind the voice client locally; re-read after awaits that may span a reconnect.
+                    vc = player.voice_client
+                    if vc.is_playing() or vc.is_paused():
                         # Clear any stale source before starting the next track.
-                        player.voice_client.stop()
+                        vc.stop()
                         await asyncio.sleep(0.15)
+                        vc = player.voice_client
 
                     bitrate = 128
-                    if player.voice_client.channel:
-                        bitrate = min(512, player.voice_client.channel.bitrate // 1000)
+                    channel = vc.channel
+                    if channel:
+                        bitrate = min(512, channel.bitrate // 1000)
                     
-                    ffmpeg_opts = self._build_ffmpeg_options(stream_info, bitrate=bitrate)
-                    source = await discord.FFmpegOpusAudio.from_probe(item.url, **ffmpeg_opts)
+                    ffmpeg_opts = self._build_ffmpeg_options(
+                        stream_info.http_headers if stream_info else None, bitrate=bitrate
+                    )
+                    # Codec is known from yt-dlp, so skip from_probe's extra ffprobe process:
+                    # pass Opus through untouched, re-encode anything else. "opus" (not "copy")
+                    # is the value every supported discord.py version maps to a stream copy.
+                    source = discord.FFmpegOpusAudio(
+                        item.url,
+                        bitrate=bitrate,
+                        codec="opus" if item.acodec == "opus" else None,
+                        **ffmpeg_opts,
+                    )
                     player._current_source = source
                     
                     play_complete = asyncio.Event()
-                    player.voice_client.play(source, after=lambda _: self.bot.loop.call_soon_threadsafe(play_complete.set))
-                    player.start_time = datetime.now(UTC)
-                    await self._ensure_obs_relay_state()
+                    player.voice_client.play(source, after=lambda _: loop.call_soon_threadsafe(play_complete.set))
+                    player.start_time = time.monotonic()
+                    item.history_id = await db_task
 
-                    asyncio.create_task(self._spotify_enrich_and_refresh_now_playing(player, item))
+                    spawn(self._spotify_enrich_and_refresh_now_playing(player, item))
 
                     should_announce, announce_reason, roll = self._should_announce_radio_presenter(item)
                     if should_announce:
-                        asyncio.create_task(self._notify_radio_presenter(player, item))
-                    else:
+                        spawn(self._notify_radio_presenter(player, item))
+                    elif announce_reason != "disabled":
                         log.debug_cat(
                             Category.API,
                             "radio_presenter_announce_skipped",
@@ -984,7 +1311,7 @@ class MusicCog(commands.Cog):
                             song=item.title,
                             artist=item.artist,
                         )
-                    await self._notify_now_playing(player)
+                    await self._post_track_start_fanout(player)
                     
                     # AI Mode: Generate suggestions for current track
                     if player.ai_mode_enabled and item.video_id:
@@ -1022,13 +1349,16 @@ class MusicCog(commands.Cog):
                         if player.voice_client.is_playing():
                             player.voice_client.stop()
                     
-                    if hasattr(self.bot, "db") and self.bot.db and item.history_id:
-                        playback_crud = PlaybackCRUD(self.bot.db)
-                        completed = not (player.skip_votes and len(player.skip_votes) > 0)
-                        await playback_crud.mark_completed(item.history_id, completed)
+                    cruds = self._get_cruds()
+                    if cruds and item.history_id:
+                        completed = not player.skip_votes
+                        await cruds.playback.mark_completed(item.history_id, completed)
 
                 except Exception as e:
                     log.event(Category.PLAYBACK, Event.PLAYBACK_ERROR, level=logging.ERROR, title=item.title, error=str(e))
+                    if item.history_id is None:
+                        # Setup failed before the history row was bound; settle it as skipped.
+                        await self._settle_failed_track_records(db_task)
                     continue
                 finally:
                     # Append the outgoing item to recent history (most-recent first)
@@ -1062,13 +1392,17 @@ class MusicCog(commands.Cog):
                     player._current_stream_info = None
                     await self._ensure_obs_relay_state()
                     # Trigger maintenance after song ends
-                    asyncio.create_task(self._fill_queue_if_needed(player))
+                    self._request_refill(player)
         
         finally:
             player.is_playing = False
             player.current = None
             player._current_source = None
             player._current_stream_info = None
+            if player._stuck_handle:
+                player._stuck_handle.cancel()
+                player._stuck_handle = None
+            self._arm_idle_timer(player)
             if player._play_task is asyncio.current_task():
                 player._play_task = None
             await self._ensure_obs_relay_state()
@@ -1076,7 +1410,7 @@ class MusicCog(commands.Cog):
                 player._maintenance_task.cancel()
 
     async def _fill_queue_if_needed(self, player: GuildPlayer):
-        """Fill the queue with discovery songs if it drops below 4 items."""
+        """Top the queue up to QUEUE_HIGH_WATER discovery songs."""
         if not player.autoplay:
             return
         
@@ -1090,57 +1424,85 @@ class MusicCog(commands.Cog):
             return
 
         # Get max duration setting
-        max_seconds = 0
-        if hasattr(self.bot, "db") and self.bot.db:
-            try:
-                guild_crud = GuildCRUD(self.bot.db)
-                max_dur = await guild_crud.get_setting(player.guild_id, "max_song_duration")
-                if max_dur:
-                    max_seconds = int(max_dur) * 60
-            except: pass
-
-        TARGET_SIZE = 4
-        while player.queue.qsize() < TARGET_SIZE:
-            log.debug_cat(Category.DISCOVERY, "Queue low, fetching discovery song", 
-                         current_size=player.queue.qsize(), target=TARGET_SIZE)
-            item = await self._get_discovery_song_with_retry(player, max_seconds=max_seconds)
-            if item:
-                await player.queue.put(item)
-                # Prefetch stream URL for the first item in queue if it doesn't have one
-                if player.queue.qsize() == 1:
-                    asyncio.create_task(self._pre_buffer_next(player))
-            else:
-                break
+        max_seconds = await self._get_max_seconds(player)
+
+        target_size = self.QUEUE_HIGH_WATER
+        player._queue_filling = True
+        try:
+            while player.queue.qsize() < target_size:
+                log.debug_cat(Category.DISCOVERY, "Queue low, fetching discovery song", 
+                             current_size=player.queue.qsize(), target=target_size)
+                item = await self._get_discovery_song_with_retry(player, max_seconds=max_seconds)
+                if item:
+                    if self._is_pending(player, item.video_id):
+                        # The prefetch buffer (or the current track) already has this pick; retry on next refill.
+                        log.debug_cat(Category.DISCOVERY, "discovery_pick_duplicate", title=item.title, target="queue")
+                        break
+                    if not await player.queue.put(item):
+                        break
+                    # Prefetch stream URL for the first item in queue if it doesn't have one
+                    if player.queue.qsize() == 1:
+                        self._spawn(self._pre_buffer_next(player))
+                else:
+                    break
+        finally:
+            player._queue_filling = False
+
+    def _request_refill(self, player: GuildPlayer) -> None:
+        """Wake the queue maintainer if the queue is at or below the low-water mark."""
+        if player.queue.qsize() <= self.QUEUE_LOW_WATER:
+            player._refill_event.set()
 
     async def _maintain_queue(self, player: GuildPlayer):
-        """Background task to keep the queue filled while the player is active."""
+        """Single consumer that refills the queue while the player is active.
+
+        Other code only signals ``_refill_event``, so at most one discovery fill runs
+        per guild. A 30s timeout re-checks the low-water mark as a safety net.
+        """
         try:
+            player._refill_event.set()  # Initial fill
             while player.voice_client and player.voice_client.is_connected():
-                if player.autoplay:
+                try:
+                    await asyncio.wait_for(player._refill_event.wait(), timeout=30)
+                except asyncio.TimeoutError:
+                    pass
+                player._refill_event.clear()
+                if player.autoplay and player.queue.qsize() <= self.QUEUE_LOW_WATER:
                     await self._fill_queue_if_needed(player)
-                await asyncio.sleep(30)  # Check every 30 seconds
         except asyncio.CancelledError:
             pass
             player.current = None
     
+    def _get_voice_member_ids(self, player: GuildPlayer) -> list[int]:
+        """Non-bot member ids in the bot's channel, rebuilt only after a voice state change.
+
+        The returned list is shared; callers must not mutate it.
+        """
+        channel = player.voice_client.channel if player.voice_client else None
+        if channel is None:
+            return []
+        cached = player._voice_member_ids
+        if cached is None or cached[0] != channel.id:
+            cached = player._voice_member_ids = (channel.id, [m.id for m in channel.members if not m.bot])
+        return cached[1]
+
     async def _get_discovery_song(self, player: GuildPlayer) -> QueueItem | None:
         """Get next song from discovery engine (AI-preferred if enabled)."""
         # Get voice channel members
         if not player.voice_client or not player.voice_client.channel:
             return None
         
-        voice_members = [m.id for m in player.voice_client.channel.members if not m.bot]
+        voice_members = self._get_voice_member_ids(player)
         if not voice_members:
             return None
         
         # Try AI discovery first if enabled
-        if hasattr(self.bot, "db") and self.bot.db:
+        if self._get_cruds():
             try:
-                guild_crud = GuildCRUD(self.bot.db)
-                ai_enabled = await guild_crud.get_setting(player.guild_id, "ai_discovery_enabled")
+                ai_enabled = await self._get_setting_cached(player.guild_id, "ai_discovery_enabled")
                 
                 if ai_enabled:
-                    ai_client = getattr(self.bot, "ai_client", None)
+                    ai_client = self._ai_client
                     if ai_client:
                         ai_available = await ai_client.health_check()
                         if ai_available:
@@ -1158,29 +1520,19 @@ class MusicCog(commands.Cog):
                 log.error_cat(Category.DISCOVERY, "AI discovery check failed", error=str(e), guild_id=player.guild_id)
         
         # Try traditional discovery engine
-        if hasattr(self.bot, "discovery") and self.bot.discovery:
+        if self._discovery is not None:
             try:
                 # Get Cooldown Setting
-                cooldown = 7200 # Default 2 hours
-                if hasattr(self.bot, "db"):
-                    guild_crud = GuildCRUD(self.bot.db)
-                    setting = await guild_crud.get_setting(player.guild_id, "replay_cooldown")
-                    if setting:
-                        try:
-                            cooldown = int(setting)
-                        except ValueError:
-                            pass
+                # Default 2 hours
+                cooldown = await self._get_int_setting_cached(player.guild_id, "replay_cooldown", 7200)
 
-                discovered = await self.bot.discovery.get_next_song(
+                discovered = await self._discovery.get_next_song(
                     player.guild_id,
                     voice_members,
                     cooldown_seconds=cooldown
                 )
                 if discovered:
-                    # Normalize discovery source names for DB compatibility across schema versions.
-                    # Some older DBs used 'artist' and some used 'same_artist'.
-                    source_map = {"same_artist": "artist"}
-                    db_source = source_map.get(discovered.strategy, discovered.strategy)
+                    db_source = _DISCOVERY_SOURCE_MAP.get(discovered.strategy, discovered.strategy)
                     return QueueItem(
                         video_id=discovered.video_id,
                         title=discovered.title,
@@ -1208,28 +1560,28 @@ class MusicCog(commands.Cog):
         Uses the "democratic" user selection from voice members, fetches their likes,
         and asks AI for suggestions.
         """
-        if not voice_members or not hasattr(self.bot, "db") or not self.bot.db:
+        cruds = self._get_cruds()
+        if not voice_members or cruds is None:
             return None
         
-        ai_client = getattr(self.bot, "ai_client", None)
+        ai_client = self._ai_client
         if not ai_client:
             return None
         
         try:
-            from src.database.crud import ReactionCRUD, PlaybackCRUD, SongCRUD
-            reaction_crud = ReactionCRUD(self.bot.db)
-            playback_crud = PlaybackCRUD(self.bot.db)
-            song_crud = SongCRUD(self.bot.db)
-            guild_crud = GuildCRUD(self.bot.db)
+            reaction_crud = cruds.reaction
+            playback_crud = cruds.playback
+            song_crud = cruds.song
+            guild_crud = cruds.guild
             
             # Pick a "democratic" user (rotate or choose based on existing logic)
             # For simplicity, pick the first user or use existing democratic logic
             # If the discovery engine has a user selection method, reuse it
             target_user_id = voice_members[0]
-            if hasattr(self.bot, "discovery") and self.bot.discovery:
+            if self._discovery is not None:
                 try:
                     # Try to use discovery engine's democratic user selection
-                    demo_user = await self.bot.discovery._pick_democratic_user(player.guild_id, voice_members)
+                    demo_user = await self._discovery._pick_democratic_user(player.guild_id, voice_members)
                     if demo_user:
                         target_user_id = demo_user
                 except Exception:
@@ -1399,10 +1751,21 @@ class MusicCog(commands.Cog):
     async def _get_discovery_song_with_retry(self, player: GuildPlayer, max_seconds: int = 0) -> QueueItem | None:
         """Get discovery song with retry logic for duration limits."""
         for attempt in range(3):
-            item = await self._get_discovery_song(player)
+            if attempt:
+                # Back off (with jitter) so retries don't hammer the discovery engine.
+                await asyncio.sleep(0.25 * (2 ** attempt) + random.uniform(0, 0.1))
+
+            if player._discovery_misses >= self.DISCOVERY_MISS_LIMIT and self._get_voice_member_ids(player):
+                # The engine keeps coming back empty; don't spin on it.
+                player._discovery_misses = 0
+                item = await self._get_chart_fallback()
+            else:
+                item = await self._get_discovery_song(player)
             if not item:
+                player._discovery_misses += 1
                 return None
-            
+            player._discovery_misses = 0
+
             if max_seconds > 0 and item.duration_seconds and item.duration_seconds > max_seconds:
                 log.event(Category.DISCOVERY, "song_skipped_duration", 
                          title=item.title, duration=item.duration_seconds, 
@@ -1411,29 +1774,42 @@ class MusicCog(commands.Cog):
             return item
         return None
     
+    def _pop_prefetched_discovery(self, player: GuildPlayer) -> QueueItem | None:
+        """Oldest prefetched discovery song that hasn't gone stale, if any."""
+        buffer = player._discovery_buffer
+        now = time.monotonic()
+        while buffer:
+            expires, item = buffer.popleft()
+            if now < expires:
+                return item
+        return None
+
+    @staticmethod
+    def _is_pending(player: GuildPlayer, video_id: str) -> bool:
+        """True if a song is already playing, queued or waiting in the discovery buffer."""
+        if player.current and player.current.video_id == video_id:
+            return True
+        if any(item.video_id == video_id for _, item in player._discovery_buffer):
+            return True
+        return any(item.video_id == video_id for item in player.queue.head(player.queue.qsize()))
+
     async def _prefetch_discovery_song(self, player: GuildPlayer):
-        """Prefetch the next discovery song in background to reduce delay."""
-        if player._next_discovery:
-            return  # Already have one prefetched
-        
+        """Keep a few discovery songs (with stream URLs) ready in the background."""
+        buffer = player._discovery_buffer
         try:
             # Get max duration setting
-            guild_crud = GuildCRUD(self.bot.db) if hasattr(self.bot, "db") else None
-            max_seconds = 0
-            if guild_crud:
-                try:
-                    max_dur = await guild_crud.get_setting(player.guild_id, "max_song_duration")
-                    if max_dur:
-                        max_seconds = int(max_dur) * 60
-                except: pass
-            
-            # Get discovery song with timeout
-            item = await asyncio.wait_for(
-                self._get_discovery_song_with_retry(player, max_seconds),
-                timeout=self.DISCOVERY_TIMEOUT
-            )
-            
-            if item:
+            max_seconds = await self._get_max_seconds(player)
+
+            # Yield to the maintainer if it starts a queue fill part-way through.
+            while len(buffer) < buffer.maxlen and not player._queue_filling:
+                # Get discovery song with timeout
+                item = await asyncio.wait_for(
+                    self._get_discovery_song_with_retry(player, max_seconds),
+                    timeout=self.DISCOVERY_TIMEOUT
+                )
+                if not item:
+                    break
+
                 # Also prefetch stream URL for zero-delay playback
                 try:
                     stream_info = await asyncio.wait_for(
@@ -1442,37 +1818,57 @@ class MusicCog(commands.Cog):
                     )
                     if stream_info:
                         item.url = stream_info.url
+                        item.acodec = stream_info.acodec
+                        item.resolved_stream = stream_info
                         log.debug_cat(Category.DISCOVERY, "Prefetched discovery song with URL", title=item.title)
                 except asyncio.TimeoutError:
                     log.debug_cat(Category.DISCOVERY, "Prefetch stream URL timed out", title=item.title)
-                
-                player._next_discovery = item
+
+                # Checked after the last await so the queue fill can't slip the same song in between.
+                if self._is_pending(player, item.video_id):
+                    log.debug_cat(Category.DISCOVERY, "discovery_pick_duplicate", title=item.title, target="buffer")
+                    break
+                buffer.append((time.monotonic() + self.DISCOVERY_PREFETCH_TTL, item))
                 
         except asyncio.TimeoutError:
             log.debug_cat(Category.DISCOVERY, "Discovery prefetch timed out")
         except Exception as e:
             log.debug_cat(Category.DISCOVERY, "Discovery prefetch failed", error=str(e))
     
+    async def _cached_chart_lookup(self, key: str, fetch) -> list:
+        """Chart playlists/tracks barely change hour to hour; reuse non-empty results for CHART_CACHE_TTL."""
+        now = time.monotonic()
+        hit = self._chart_cache.get(key)
+        if hit and now < hit[0]:
+            return hit[1]
+        result = await fetch()
+        if result:
+            self._chart_cache[key] = (now + self.CHART_CACHE_TTL, result)
+        return result
+
     async def _get_chart_fallback(self) -> QueueItem | None:
         """Get a random track from Top 100 US/UK charts as fallback."""
-        import random
-        
-        region = random.choice(["US", "UK"])
+        region = _CHART_REGIONS[random.getrandbits(1)]
         query = f"Top 100 Songs {region} 2024"
         
         log.event(Category.DISCOVERY, Event.SEARCH_STARTED, query=query, type="chart_playlist")
         
         # Try to find a chart playlist
-        playlists = await self.youtube.search_playlists(query, limit=3)
+        playlists = await self._cached_chart_lookup(
+            f"playlists:{query}", lambda: self.youtube.search_playlists(query, limit=3)
+        )
         
         if playlists:
-            playlist = random.choice(playlists)
+            playlist = playlists[random.randrange(len(playlists))]
             log.event(Category.DISCOVERY, Event.SEARCH_COMPLETED, playlist=playlist.get('title', 'Unknown'))
             
             # Get tracks from playlist
-            tracks = await self.youtube.get_playlist_tracks(playlist["browse_id"], limit=50)
+            browse_id = playlist["browse_id"]
+            tracks = await self._cached_chart_lookup(
+                f"tracks:{browse_id}", lambda: self.youtube.get_playlist_tracks(browse_id, limit=50)
+            )
             if tracks:
-                track = random.choice(tracks)
+                track = tracks[random.randrange(len(tracks))]
                 return QueueItem(
                     video_id=track.video_id,
                     title=track.title,
@@ -1485,10 +1881,13 @@ class MusicCog(commands.Cog):
         
         # Direct search fallback - search for popular songs
         log.event(Category.DISCOVERY, "fallback_direct_search")
-        results = await self.enrichment.search_tracks("top hits 2024 popular", filter_type="songs", limit=20, timeout_s=8.0)
+        results = await self._cached_chart_lookup(
+            "search:top hits 2024 popular",
+            lambda: self.enrichment.search_tracks("top hits 2024 popular", filter_type="songs", limit=20, timeout_s=8.0),
+        )
         
         if results:
-            track = random.choice(results)
+            track = results[random.randrange(len(results))]
             log.event(Category.DISCOVERY, Event.SEARCH_COMPLETED, title=track.title, type="direct_search")
             return QueueItem(
                 video_id=track.video_id,
@@ -1513,7 +1912,7 @@ class MusicCog(commands.Cog):
         if not player.ai_mode_enabled:
             return
         
-        ai_client = getattr(self.bot, "ai_client", None)
+        ai_client = self._ai_client
         if not ai_client:
             return
         
@@ -1526,11 +1925,11 @@ class MusicCog(commands.Cog):
         try:
             # Build exclude list (recent + dislikes)
             exclude_list = []
-            if hasattr(self.bot, "db") and self.bot.db:
+            cruds = self._get_cruds()
+            if cruds is not None:
                 try:
-                    from src.database.crud import PlaybackCRUD, ReactionCRUD
-                    playback_crud = PlaybackCRUD(self.bot.db)
-                    reaction_crud = ReactionCRUD(self.bot.db)
+                    playback_crud = cruds.playback
+                    reaction_crud = cruds.reaction
                     
                     # Get recent playback
                     recent = await playback_crud.get_recent_history(player.guild_id, limit=100)
@@ -1539,7 +1938,7 @@ class MusicCog(commands.Cog):
                     
                     # Get dislikes from VC members
                     if player.voice_client and player.voice_client.channel:
-                        voice_members = [m.id for m in player.voice_client.channel.members if not m.bot]
+                        voice_members = self._get_voice_member_ids(player)
                         all_dislikes_map = await reaction_crud.get_disliked_songs_for_users(voice_members, limit_per_user=50)
                         for dislikes_list in all_dislikes_map.values():
                             for d in dislikes_list:
@@ -1731,8 +2130,8 @@ class MusicCog(commands.Cog):
 
     async def _spotify_enrich_and_refresh_now_playing(self, player: GuildPlayer, item: QueueItem):
         """Enrich current track metadata via Spotify without delaying playback, then refresh Now Playing only if data changed."""
-        spotify = getattr(self.bot, "spotify", None)
-        if not spotify:
+        spotify = self._spotify
+        if spotify is None:
             return
 
         if item.year and item.genre:
@@ -1741,6 +2140,23 @@ class MusicCog(commands.Cog):
         # Track what changed to decide if we should refresh
         metadata_changed = False
 
+        # Serve repeats (including "not on Spotify") from memory.
+        cache_key = ((item.artist or "").lower(), (item.title or "").lower())
+        cached = self._spotify_enrich_cache.get(cache_key)
+        if cached and time.monotonic() < cached[0]:
+            _, year, genre = cached
+            if year and not item.year:
+                item.year = year
+                metadata_changed = True
+            if genre and not item.genre:
+                item.genre = genre
+                metadata_changed = True
+            if metadata_changed:
+                # The same artist/title can sit under another song row; save it there too.
+                await self._persist_spotify_enrichment(item)
+                await self._refresh_now_playing_after_enrich(player, item)
+            return
+
         try:
             query = f"{item.artist} {item.title}"
             sp_track = await asyncio.wait_for(
@@ -1748,37 +2164,25 @@ class MusicCog(commands.Cog):
                 timeout=self.SPOTIFY_ENRICH_TIMEOUT,
             )
             if not sp_track:
+                self._remember_spotify_enrichment(cache_key, None, None)
                 return
 
             if not item.year:
                 item.year = sp_track.release_year
                 metadata_changed = True
 
-            artist = await asyncio.wait_for(
-                spotify.get_artist(sp_track.artist_id),
-                timeout=self.SPOTIFY_ENRICH_TIMEOUT,
-            )
-            if artist and artist.genres and not item.genre:
-                item.genre = artist.genres[0].title()
-                metadata_changed = True
+            # Artist lookup is only needed for the genre.
+            if not item.genre and sp_track.artist_id:
+                artist = await asyncio.wait_for(
+                    spotify.get_artist(sp_track.artist_id), timeout=self.SPOTIFY_ENRICH_TIMEOUT
+                )
+                if artist and artist.genres and not item.genre:
+                    item.genre = artist.genres[0].title()
+                    metadata_changed = True
 
-            if hasattr(self.bot, "db") and self.bot.db and item.song_db_id:
-                try:
-                    song_crud = SongCRUD(self.bot.db)
-
-                    if item.genre:
-                        await song_crud.clear_genres(item.song_db_id)
-                        await song_crud.add_genre(item.song_db_id, item.genre)
-
-                    await song_crud.get_or_create_by_yt_id(
-                        canonical_yt_id=item.video_id,
-                        title=item.title,
-                        artist_name=item.artist,
-                        release_year=item.year,
-                        duration_seconds=item.duration_seconds,
-                    )
-                except Exception as e:
-                    log.debug_cat(Category.DATABASE, "Failed to persist Spotify enrichment", error=str(e))
+            self._remember_spotify_enrichment(cache_key, sp_track.release_year, item.genre)
+
+            await self._persist_spotify_enrichment(item)
 
         except asyncio.TimeoutError:
             log.debug_cat(Category.API, "Spotify enrichment timed out", title=item.title, artist=item.artist)
@@ -1787,85 +2191,160 @@ class MusicCog(commands.Cog):
             log.debug_cat(Category.API, "Spotify enrichment failed", error=str(e))
             return
 
-        # Only refresh Now Playing if metadata actually changed and this is still the current song
+        # Only refresh Now Playing if metadata actually changed
         if metadata_changed:
-            try:
-                # Give the initial Now Playing send a chance to complete to avoid racing two sends.
-                await asyncio.sleep(3)
-                if not player.current or player.current.video_id != item.video_id:
-                    return
-                await self._notify_now_playing(player)
-            except Exception as e:
-                log.debug_cat(Category.SYSTEM, "Failed to refresh Now Playing after Spotify enrichment", error=str(e))
+            await self._refresh_now_playing_after_enrich(player, item)
+
+    async def _persist_spotify_enrichment(self, item: QueueItem):
+        """Save enriched year/genre to the item's song row, if it has one."""
+        cruds = self._get_cruds()
+        if cruds is None or not item.song_db_id:
+            return
+        try:
+            await cruds.song.persist_enrichment(
+                item.song_db_id,
+                release_year=item.year,
+                duration_seconds=item.duration_seconds,
+                genre=item.genre,
+            )
+        except Exception as e:
+            log.debug_cat(Category.DATABASE, "Failed to persist Spotify enrichment", error=str(e))
+
+    def _remember_spotify_enrichment(self, key: tuple, year: Optional[int], genre: Optional[str]):
+        """Memoize an enrichment result (or miss) so repeats skip Spotify entirely."""
+        cache = self._spotify_enrich_cache
+        if len(cache) >= self.SPOTIFY_ENRICH_CACHE_MAX and key not in cache:
+            cache.pop(next(iter(cache)))
+        cache[key] = (time.monotonic() + self.SPOTIFY_ENRICH_CACHE_TTL, year, genre)
+
+    async def _refresh_now_playing_after_enrich(self, player: GuildPlayer, item: QueueItem):
+        """Re-send Now Playing if the enriched item is still the current song."""
+        try:
+            # Give the initial Now Playing send a chance to complete to avoid racing two sends.
+            await asyncio.sleep(3)
+            if not player.current or player.current.video_id != item.video_id:
+                return
+            await self._notify_now_playing(player)
+        except Exception as e:
+            log.debug_cat(Category.SYSTEM, "Failed to refresh Now Playing after Spotify enrichment", error=str(e))
     
 
+    async def _post_track_start_fanout(self, player: GuildPlayer):
+        """Run the independent post-start updates concurrently.
+
+        Safe to overlap: the OBS relay only reads which players are playing, and Now Playing
+        only reads ``player.current``. Spotify enrichment (writes ``item``), pre-buffering
+        (``player._next_url``) and discovery prefetch (``player._discovery_buffer``) touch
+        disjoint state and are already spawned separately, since they may take seconds.
+        """
+        results = await asyncio.gather(
+            self._ensure_obs_relay_state(),
+            self._notify_now_playing(player),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.debug_cat(Category.PLAYBACK, "post_track_start_update_failed", guild_id=player.guild_id, error=str(result))
+
     async def _pre_buffer_next(self, player: GuildPlayer):
         """Pre-buffer the next song's URL."""
         try:
             # Peek at next item without removing
-            if player.queue.empty():
+            next_item = player.queue.peek()
+            if next_item is None:
                 return
 
-            next_item = list(player.queue._queue)[0]
             if not next_item.url:
-                stream_info = await self.youtube.get_stream_url(next_item.video_id)
+                stream_info = await self._resolve_stream(next_item)
                 if stream_info:
                     next_item.url = stream_info.url
+                    next_item.acodec = stream_info.acodec
+                    next_item.resolved_stream = stream_info
                     player._next_url = stream_info.url
                     log.debug_cat(Category.QUEUE, "Pre-buffered URL", title=next_item.title)
         except Exception as e:
             log.debug_cat(Category.QUEUE, "Pre-buffer failed", error=str(e))
     
-    async def _idle_check_loop(self):
-        """Check for idle players, stuck players, and disconnect when needed."""
-        STUCK_THRESHOLD = 300  # 5 minutes without health check update = stuck
-        
-        while True:
-            await asyncio.sleep(60)  # Check every minute
-            
-            now = datetime.now(UTC)
-            for guild_id, player in list(self.players.items()):
-                if not player.voice_client or not player.voice_client.is_connected():
-                    continue
+    def _arm_idle_timer(self, player: GuildPlayer, delay: float | None = None) -> None:
+        """(Re)schedule the idle check for a player; replaces any pending one."""
+        if player._idle_handle:
+            player._idle_handle.cancel()
+        player._idle_handle = asyncio.get_running_loop().call_later(
+            self.IDLE_TIMEOUT if delay is None else delay, self._on_idle_timer, player
+        )
 
-                # Check if idle for too long (only when truly inactive).
-                idle_seconds = (now - player.last_activity).total_seconds()
-                vc = player.voice_client
-                vc_active = False
-                try:
-                    vc_active = bool(vc and (vc.is_playing() or vc.is_paused()))
-                except Exception:
-                    vc_active = False
-
-                has_active_work = bool(
-                    player.is_playing
-                    or vc_active
-                    or player.current is not None
-                    or not player.queue.empty()
-                    or player.autoplay
-                )
-                if idle_seconds > self.IDLE_TIMEOUT and not has_active_work:
-                    log.event(Category.VOICE, Event.VOICE_DISCONNECTED, guild_id=guild_id, reason="idle_timeout")
-                    await player.voice_client.disconnect()
-                    player.voice_client = None
-                    continue
-                
-                # Check if player is stuck
-                if player.is_playing:
-                    time_since_health = (now - player._last_health_check).total_seconds()
-                    if time_since_health > STUCK_THRESHOLD:
-                        log.warning_cat(Category.PLAYBACK, "Stuck player detected - auto-restarting", 
-                                      guild_id=guild_id, stuck_seconds=time_since_health)
-                        
-                        try:
-                            if player.voice_client.is_playing():
-                                player.voice_client.stop()
-                        except Exception:
-                            pass
-                        
-                        player.is_playing = False
-                        player._consecutive_failures = 0
-                        # Restart loop happens in next iteration if autoplay is on or queue not empty
+    def _on_idle_timer(self, player: GuildPlayer) -> None:
+        player._idle_handle = None
+        if not player.voice_client or not player.voice_client.is_connected():
+            return  # Disconnected; nothing to watch until the next play loop
+        self._spawn(self._check_idle(player))
+
+    async def _check_idle(self, player: GuildPlayer) -> None:
+        """Disconnect a player that has been truly inactive for IDLE_TIMEOUT, else re-arm."""
+        idle_seconds = time.monotonic() - player.last_activity
+        vc = player.voice_client
+        vc_active = False
+        try:
+            vc_active = bool(vc and (vc.is_playing() or vc.is_paused()))
+        except Exception:
+            vc_active = False
+
+        has_active_work = bool(
+            player.is_playing
+            or vc_active
+            or player.current is not None
+            or not player.queue.empty()
+            or player.autoplay
+        )
+        if has_active_work:
+            self._arm_idle_timer(player)
+        elif idle_seconds < self.IDLE_TIMEOUT:
+            # Activity since the timer was armed; wait out the remainder.
+            self._arm_idle_timer(player, self.IDLE_TIMEOUT - idle_seconds)
+        else:
+            log.event(Category.VOICE, Event.VOICE_DISCONNECTED, guild_id=player.guild_id, reason="idle_timeout")
+            await vc.disconnect()
+            player.voice_client = None
+            self._release_player_resources(player)
+
+    def _release_player_resources(self, player: GuildPlayer) -> None:
+        """Stop timers and background tasks of an idle player; its settings and history are kept."""
+        if player.voice_client or player.current or not player.queue.empty():
+            return
+        for handle in (player._idle_handle, player._stuck_handle):
+            if handle:
+                handle.cancel()
+        player._idle_handle = None
+        player._stuck_handle = None
+        for task in (player._prefetch_task, player._maintenance_task, player._ai_generation_task):
+            if task and not task.done():
+                task.cancel()
+
+    def _arm_stuck_timer(self, player: GuildPlayer) -> None:
+        """Restart the stuck-player watchdog; called on every health-check update."""
+        player._last_health_check = time.monotonic()
+        if player._stuck_handle:
+            player._stuck_handle.cancel()
+        player._stuck_handle = asyncio.get_running_loop().call_later(
+            self.STUCK_THRESHOLD, self._on_player_stuck, player
+        )
+
+    def _on_player_stuck(self, player: GuildPlayer) -> None:
+        player._stuck_handle = None
+        if not player.is_playing or not player.voice_client or not player.voice_client.is_connected():
+            return
+        log.warning_cat(Category.PLAYBACK, "Stuck player detected - auto-restarting",
+                      guild_id=player.guild_id, stuck_seconds=time.monotonic() - player._last_health_check)
+
+        try:
+            if player.voice_client.is_playing():
+                player.voice_client.stop()
+        except Exception:
+            pass
+
+        player.is_playing = False
+        player._consecutive_failures = 0
+        # Restart happens via the watchdog reconcile if autoplay is on or queue not empty
 
     async def reconcile_voice_state(self) -> None:
         """Reconcile internal player voice state with discord.py's guild voice clients."""
@@ -1965,19 +2444,20 @@ class MusicCog(commands.Cog):
         resolves to playable tracks, and queues them.
         """
         # Debounce: ignore if user joined within last 30 seconds
-        now = datetime.now(UTC)
+        now = time.monotonic()
         last_join = player._join_debounce.get(member.id)
-        if last_join and (now - last_join).total_seconds() < 30:
+        if last_join is not None and now - last_join < 30:
             return
         
         player._join_debounce[member.id] = now
         
         # Check if feature is enabled
-        if not hasattr(self.bot, "db") or not self.bot.db:
+        cruds = self._get_cruds()
+        if cruds is None:
             return
         
         try:
-            guild_crud = GuildCRUD(self.bot.db)
+            guild_crud = cruds.guild
             ai_on_join = await guild_crud.get_setting(member.guild.id, "ai_discovery_on_join")
             if not ai_on_join:
                 return
@@ -1985,7 +2465,7 @@ class MusicCog(commands.Cog):
             return
         
         # Check if Local AI provider is available
-        ai_client = getattr(self.bot, "ai_client", None)
+        ai_client = self._ai_client
         if not ai_client:
             return
         
@@ -2001,9 +2481,8 @@ class MusicCog(commands.Cog):
         
         # Fetch user preferences and VC-wide dislikes asynchronously
         try:
-            from src.database.crud import ReactionCRUD, PlaybackCRUD
-            reaction_crud = ReactionCRUD(self.bot.db)
-            playback_crud = PlaybackCRUD(self.bot.db)
+            reaction_crud = cruds.reaction
+            playback_crud = cruds.playback
             
             # Get user's likes and dislikes
             liked_tracks = await reaction_crud.get_liked_songs(member.id, limit=20)
@@ -2116,8 +2595,7 @@ class MusicCog(commands.Cog):
                     # Persist to DB
                     song_db_id = None
                     try:
-                        from src.database.crud import SongCRUD
-                        song_crud = SongCRUD(self.bot.db)
+                        song_crud = cruds.song
                         song = await song_crud.get_or_create_by_yt_id(
                             canonical_yt_id=track.video_id,
                             title=track.title,
@@ -2143,7 +2621,8 @@ class MusicCog(commands.Cog):
                         duration_seconds=duration_seconds,
                         year=getattr(track, "year", None),
                     )
-                    player.queue.put_nowait(item)
+                    if not player.queue.put_nowait(item):
+                        break
                     seen_ids.add(track.video_id)
                     queued_count += 1
                     
@@ -2190,6 +2669,11 @@ class MusicCog(commands.Cog):
         after: discord.VoiceState
     ):
         """Handle voice state changes."""
+        if before.channel != after.channel:
+            player = self.players.get(member.guild.id)
+            if player:
+                player._voice_member_ids = None  # Membership changed somewhere in the guild
+
         # Handle bot being disconnected or moved
         if member.id == self.bot.user.id:
             if after.channel:
@@ -2212,9 +2696,9 @@ class MusicCog(commands.Cog):
                                 error=str(e),
                             )
                     # Also schedule a delayed check to handle out-of-order reconnect events.
-                    asyncio.create_task(self._resume_playback_after_reconnect(member.guild.id))
+                    self._spawn(self._resume_playback_after_reconnect(member.guild.id))
             elif before.channel and not after.channel:
-                asyncio.create_task(self._confirm_voice_disconnect(member.guild.id, member.guild.name))
+                self._spawn(self._confirm_voice_disconnect(member.guild.id, member.guild.name))
             return
 
         if member.bot:
@@ -2234,8 +2718,7 @@ class MusicCog(commands.Cog):
         
         # Check if bot is alone in its current voice channel
         if before.channel == player.voice_client.channel and not after.channel == player.voice_client.channel:
-            members = [m for m in player.voice_client.channel.members if not m.bot]
-            if not members:
+            if not any(not m.bot for m in player.voice_client.channel.members):
                 # Everyone left, stop and disconnect
                 if player.voice_client.is_playing():
                     player.voice_client.stop()
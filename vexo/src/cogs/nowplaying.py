@@ -614,11 +614,10 @@ class NowPlayingView(discord.ui.View):
             # Selected value is present in interaction.data['values']
             values = interaction.data.get("values") if isinstance(interaction.data, dict) else None
             selected_index = int(values[0]) if values and len(values) > 0 else 0
-            queue_items = list(player.queue._queue)
-
-            if selected_index < 0 or selected_index >= len(queue_items):
+            if selected_index < 0 or selected_index >= player.queue.qsize():
                 await self._safe_send(interaction, "❌ Invalid queue position.", ephemeral=True)
                 return
+            queue_items = player.queue.head(selected_index + 1)
 
             # Remove all items before the selected index
             for _ in range(selected_index):
@@ -687,19 +686,9 @@ class NowPlayingView(discord.ui.View):
             selected_track = ai_alternatives[selected_index]
             
             # Insert at front of queue (play next) without interrupting current playback.
-            temp_queue = []
-            while not player.queue.empty():
-                try:
-                    temp_queue.append(player.queue.get_nowait())
-                except asyncio.QueueEmpty:
-                    break
-
-            # Add selected AI track first (it will be played after the current track)
-            player.queue.put_nowait(selected_track)
-
-            # Re-add all other items
-            for item in temp_queue:
-                player.queue.put_nowait(item)
+            if not player.queue.put_at_front(selected_track):
+                await self._safe_send(interaction, "❌ The queue is full. Skip or clear some tracks first.", ephemeral=True)
+                return
 
             await self._safe_toast(
                 interaction,
@@ -776,7 +765,9 @@ class NowPlayingView(discord.ui.View):
                     year=src.year,
                 )
                 # Enqueue at tail
-                player.queue.put_nowait(clone)
+                if not player.queue.put_nowait(clone):
+                    await self._safe_send(interaction, "❌ The queue is full. Skip or clear some tracks first.", ephemeral=True)
+                    return
                 await self._safe_toast(interaction, f"🔁 Queued **{clone.title}** to play again after the queue")
                 log.info_cat(Category.USER, "history_replay_enqueued", guild_id=guild_id, user_id=interaction.user.id, title=clone.title, artist=clone.artist)
                 return
@@ -808,7 +799,9 @@ class NowPlayingView(discord.ui.View):
                     year=src.year,
                 )
                 # Insert at front so it becomes next
-                player.queue.put_at_front(clone)
+                if not player.queue.put_at_front(clone):
+                    await self._safe_send(interaction, "❌ The queue is full. Skip or clear some tracks first.", ephemeral=True)
+                    return
                 await self._safe_toast(interaction, f"⏭️ Queued next **{clone.title}** by {clone.artist}")
                 log.info_cat(Category.USER, "history_prev_queued_next", guild_id=guild_id, user_id=interaction.user.id, title=clone.title, artist=clone.artist)
                 return
@@ -1122,7 +1115,7 @@ class NowPlayingCog(commands.Cog):
             self._np_artwork_swap_attempted_video.pop(player.guild_id, None)
 
         # Create view with dynamic queue select options (top 10)
-        queue_items = list(player.queue._queue)[:10]
+        queue_items = player.queue.head(10)
         
         # Add AI alternatives if in AI mode
         ai_alternatives = []
@@ -1429,7 +1422,7 @@ class NowPlayingCog(commands.Cog):
         current_time_str = "0:00"
         progress_percent = 0
         if player.start_time:
-            elapsed = (datetime.now(UTC) - player.start_time).total_seconds()
+            elapsed = time.monotonic() - player.start_time
             minutes, seconds = divmod(int(elapsed), 60)
             current_time_str = f"{minutes}:{seconds:02d}"
             if item.duration_seconds:
@@ -1473,7 +1466,7 @@ class NowPlayingCog(commands.Cog):
         image_url = f"http://dashboard:3000/api/now-playing/image?{query_str}"
 
         # Updated view (queue may have changed)
-        queue_items = list(player.queue._queue)[:10]
+        queue_items = player.queue.head(10)
         view = NowPlayingView(self.bot, queue_items=queue_items, recent_history=list(player.recent_history) if getattr(player, 'recent_history', None) else None, current_item=player.current)
 
         try:
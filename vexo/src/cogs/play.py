@@ -5,7 +5,6 @@ Keeps `/play ...` commands separate from the music player / playback loop implem
 """
 import asyncio
 import time
-from datetime import datetime, UTC
 
 import discord
 from discord import app_commands
@@ -246,8 +245,10 @@ class PlayCog(commands.Cog):
                 duration_seconds=duration_seconds,
                 year=track.year,
             )
-            player.queue.put_at_front(item)
-            player.last_activity = datetime.now(UTC)
+            if not player.queue.put_at_front(item):
+                await interaction.followup.send("❌ The queue is full. Skip or clear some tracks first.", ephemeral=True)
+                return
+            player.last_activity = time.monotonic()
 
             await music.ensure_play_loop(player, reason="play_song")
 
@@ -328,6 +329,7 @@ class PlayCog(commands.Cog):
 
             tracks_to_add = top_tracks[:5]
             queued_count = 0
+            queue_full = False
 
             # Add tracks in reverse order so they appear in correct top-5 order at the front
             for yt_track in reversed(tracks_to_add):
@@ -359,16 +361,21 @@ class PlayCog(commands.Cog):
                         duration_seconds=yt_track.duration_seconds,
                         year=yt_track.year,
                     )
-                    player.queue.put_at_front(item)
+                    if not player.queue.put_at_front(item):
+                        queue_full = True
+                        break
                     queued_count += 1
                 except Exception as e:
                     log.error_cat(Category.SYSTEM, "Failed to queue artist track", error=str(e), title=getattr(yt_track, "title", None))
 
+            if queued_count == 0 and queue_full:
+                await interaction.followup.send("❌ The queue is full. Skip or clear some tracks first.", ephemeral=True)
+                return
             if queued_count == 0:
                 await interaction.followup.send(f"❌ Failed to find playable tracks for: `{sp_artist.name}`", ephemeral=True)
                 return
 
-            player.last_activity = datetime.now(UTC)
+            player.last_activity = time.monotonic()
 
             await music.ensure_play_loop(player, reason="play_artist")
 
@@ -449,7 +456,7 @@ class PlayCog(commands.Cog):
                     return
 
             player.autoplay = True
-            player.last_activity = datetime.now(UTC)
+            player.last_activity = time.monotonic()
 
             await music.ensure_play_loop(player, reason="play_any")
 
@@ -647,8 +654,10 @@ class PlayCog(commands.Cog):
                 duration_seconds=duration_seconds,
                 year=seed_track.year,
             )
-            player.queue.put_nowait(seed_item)
-            player.last_activity = datetime.now(UTC)
+            if not player.queue.put_nowait(seed_item):
+                await interaction.followup.send("❌ The queue is full. Skip or clear some tracks first.", ephemeral=True)
+                return
+            player.last_activity = time.monotonic()
 
             log.event(Category.QUEUE, Event.TRACK_QUEUED, title=seed_track.title, artist=seed_track.artist, source="ai_play_seed")
 
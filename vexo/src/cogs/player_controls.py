@@ -150,7 +150,7 @@ class PlayerControlsCog(commands.Cog):
             if player.queue.empty():
                 embed.add_field(name="Up Next", value="Queue is empty", inline=False)
             else:
-                items = list(player.queue._queue)[:10]
+                items = player.queue.head(10)
                 upcoming = [f"{i}. **{item.title}** - {item.artist}" for i, item in enumerate(items, 1)]
                 embed.add_field(name="Up Next", value="\n".join(upcoming), inline=False)
 
@@ -137,6 +137,10 @@ class SettingsCog(commands.Cog):
             guild_crud = GuildCRUD(self.bot.db)
             await guild_crud.set_setting(interaction.guild_id, "radio_presenter_enabled", enabled)
 
+        music = self.bot.get_cog("MusicCog")
+        if music:
+            music.invalidate_guild_settings(interaction.guild_id)
+
         await interaction.response.send_message(
             f"Radio presenter {'enabled' if enabled else 'disabled'}",
             ephemeral=True,
@@ -138,6 +138,30 @@ class SongCRUD:
     async def clear_genres(self, song_id: int) -> None:
         """Clear all genres for a song."""
         await self.db.execute("DELETE FROM song_genres WHERE song_id = ?", (song_id,))
+
+    async def persist_enrichment(
+        self,
+        song_id: int,
+        release_year: int | None = None,
+        duration_seconds: int | None = None,
+        genre: str | None = None,
+    ) -> None:
+        """Fill missing year/duration and replace genres in a single transaction."""
+        async with self.db.connection() as db:
+            await db.execute(
+                """UPDATE songs
+                   SET release_year = COALESCE(NULLIF(release_year, 0), ?),
+                       duration_seconds = COALESCE(NULLIF(duration_seconds, 0), ?)
+                   WHERE id = ?""",
+                (release_year, duration_seconds, song_id)
+            )
+            if genre:
+                await db.execute("DELETE FROM song_genres WHERE song_id = ?", (song_id,))
+                await db.execute(
+                    "INSERT OR IGNORE INTO song_genres (song_id, genre) VALUES (?, ?)",
+                    (song_id, genre.lower())
+                )
+            await db.commit()
     
     
     async def get_genres(self, song_id: int) -> list[str]:
@@ -240,6 +264,25 @@ class GuildCRUD:
                 return row["setting_value"]
         return None
     
+    async def get_settings(self, guild_id: int, keys: list[str]) -> dict[str, Any]:
+        """Get several guild settings in one query; unset keys are omitted."""
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        rows = await self.db.fetch_all(
+            f"SELECT setting_key, setting_value FROM guild_settings WHERE guild_id = ? AND setting_key IN ({placeholders})",
+            (guild_id, *keys)
+        )
+        result = {}
+        for row in rows:
+            if not row["setting_value"]:
+                continue
+            try:
+                result[row["setting_key"]] = json.loads(row["setting_value"])
+            except json.JSONDecodeError:
+                result[row["setting_key"]] = row["setting_value"]
+        return result
+    
     async def set_setting(self, guild_id: int, key: str, value: Any) -> None:
         """Set a guild setting value."""
         value_str = json.dumps(value) if not isinstance(value, str) else value
@@ -211,3 +211,4 @@ CREATE INDEX IF NOT EXISTS idx_history_played_at ON playback_history(played_at);
 CREATE INDEX IF NOT EXISTS idx_prefs_user ON user_preferences(user_id);
 CREATE INDEX IF NOT EXISTS idx_reactions_user ON song_reactions(user_id);
 CREATE INDEX IF NOT EXISTS idx_reactions_song ON song_reactions(song_id);
+CREATE INDEX IF NOT EXISTS idx_reactions_song_reaction ON song_reactions(song_id, reaction, user_id);
@@ -58,6 +58,7 @@ class StreamInfo:
     """Stream URL and HTTP headers extracted by yt-dlp."""
     url: str
     http_headers: dict[str, str] | None = None
+    acodec: str | None = None  # Audio codec reported by yt-dlp (e.g. "opus")
 
 
 class YouTubeService:
@@ -317,6 +318,7 @@ class YouTubeService:
                     return StreamInfo(
                         url=stream_url,
                         http_headers=info.get("http_headers"),
+                        acodec=info.get("acodec"),
                     )
 
             return await loop.run_in_executor(None, extract)
@@ -217,8 +217,12 @@ function initWebSocket() {
             updateWsStatus(true);
         };
         ws.onmessage = (e) => {
-            const log = JSON.parse(e.data);
-            addLogEntry(log);
+            const data = JSON.parse(e.data);
+            if (data.type === 'log_batch') {
+                (data.logs || []).forEach(addLogEntry);
+            } else {
+                addLogEntry(data);
+            }
         };
         ws.onclose = () => {
             logState.wsConnected = false;
@@ -1028,8 +1032,8 @@ function updateSongsList(songs) {
                 <td>${durationStr}</td>
                 <td>${s.genre || '-'}</td>
                 <td><span class="user-list">${s.requested_by || '-'}</span></td>
-                <td><span class="user-list liked">${s.liked_by || '-'}</span></td>
-                <td><span class="user-list disliked">${s.disliked_by || '-'}</span></td>
+                <td><span class="user-list liked">${(s.liked_by || []).join(', ') || '-'}</span></td>
+                <td><span class="user-list disliked">${(s.disliked_by || []).join(', ') || '-'}</span></td>
                 <td>${timeStr}</td>
             </tr>
         `;